@@ -4,73 +4,157 @@ Professional corporate resume formatting
 """
 
 import io
+import os
 import re
+import zipfile
+from xml.sax.saxutils import escape as xml_escape
+from typing import NamedTuple, Sequence
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import nsdecls
+from docx.oxml import parse_xml
 import copy
 
+# Bottom border fragment, parsed once and copied into each section header
+HORIZONTAL_LINE_XML = parse_xml(
+    f'<w:pBdr {nsdecls("w")}>'
+    '<w:bottom w:val="single" w:sz="6" w:space="1" w:color="2C3E7A"/>'
+    '</w:pBdr>'
+)
+# Elements CT_PPr allows after w:pBdr - the border has to be inserted ahead of them
+PBDR_SUCCESSORS = (
+    'w:shd', 'w:tabs', 'w:suppressAutoHyphens', 'w:kinsoku', 'w:wordWrap', 'w:overflowPunct',
+    'w:topLinePunct', 'w:autoSpaceDE', 'w:autoSpaceDN', 'w:bidi', 'w:adjustRightInd',
+    'w:snapToGrid', 'w:spacing', 'w:ind', 'w:contextualSpacing', 'w:mirrorIndents',
+    'w:suppressOverlap', 'w:jc', 'w:textDirection', 'w:textAlignment', 'w:textboxTightWrap',
+    'w:outlineLvl', 'w:divId', 'w:cnfStyle', 'w:rPr', 'w:sectPr', 'w:pPrChange',
+)
+
+# ── Color Constants ──────────────────────────────────────────────────────────
+COLOR_HEADING = RGBColor(0x1A, 0x3A, 0x6B)   # Dark professional blue
+COLOR_SUBHEADING = RGBColor(0x2C, 0x2C, 0x2C) # Near black
+COLOR_BODY = RGBColor(0x33, 0x33, 0x33)        # Dark gray
+COLOR_META = RGBColor(0x55, 0x55, 0x55)        # Medium gray
+
+# ── Length Constants (built once, shared by every paragraph) ────────────────
+PAGE_MARGIN_VERTICAL = Inches(0.75)
+PAGE_MARGIN_HORIZONTAL = Inches(1.0)
+BULLET_LEFT_INDENT = Inches(0.25)
+BULLET_FIRST_LINE_INDENT = Inches(-0.2)
+NO_INDENT = Inches(0)
+SPACING_PT = {points: Pt(points) for points in (0, 1, 2, 3, 4, 6, 8, 10)}
+
+# Line classification for the free-text sections
+YEAR_PATTERN = re.compile(r'\d{4}')
+# A bullet line's first char is its marker - dropping it plus whitespace is the clean text
+BULLET_CHARS = frozenset('•-–●*')
+CERT_BULLET_CHARS = frozenset('•-–')
+# Contact fields in display order, shared by the DOCX, HTML and PDF renderers
+CONTACT_KEYS = ("email", "phone", "location", "linkedin", "github")
+# Section titles shared by every renderer (each applies its own case/escaping)
+SECTION_TITLES = {
+    "summary": "Professional Summary",
+    "skills": "Core Competencies & Technical Skills",
+    "experience": "Professional Experience",
+    "education": "Education",
+    "projects": "Key Projects",
+    "certifications": "Certifications & Credentials",
+}
+
+# One case-insensitive scan instead of lowering the line and testing each keyword
+DEGREE_PATTERN = re.compile(r'bachelor|master|phd|b\.s\.|m\.s\.|degree|diploma', re.IGNORECASE)
+
+
+def contact_items(contact: dict) -> list:
+    """Non-empty contact values in CONTACT_KEYS order"""
+    return [value for key in CONTACT_KEYS if (value := contact.get(key))]
+
+
+class ExperienceEntry(NamedTuple):
+    """One experience entry, normalized once before rendering"""
+    company: str = ""
+    role: str = ""
+    dates: str = ""
+    location: str = ""
+    bullets: Sequence[str] = ()
+    raw: str = ""
+    
+    @classmethod
+    def from_dict(cls, entry: dict) -> "ExperienceEntry":
+        return cls(*(entry.get(field, default) for field, default in cls._field_defaults.items()))
+
 
 def add_horizontal_line(paragraph):
     """Add a horizontal line below a paragraph"""
-    p = paragraph._p
-    pPr = p.get_or_add_pPr()
-    pBdr = OxmlElement('w:pBdr')
-    bottom = OxmlElement('w:bottom')
-    bottom.set(qn('w:val'), 'single')
-    bottom.set(qn('w:sz'), '6')
-    bottom.set(qn('w:space'), '1')
-    bottom.set(qn('w:color'), '2C3E7A')
-    pBdr.append(bottom)
-    pPr.append(pBdr)
+    paragraph._p.get_or_add_pPr().insert_element_before(
+        copy.deepcopy(HORIZONTAL_LINE_XML), *PBDR_SUCCESSORS)
 
 
 def set_paragraph_spacing(paragraph, before=0, after=0, line_spacing=None):
     """Set spacing for a paragraph"""
     pf = paragraph.paragraph_format
-    pf.space_before = Pt(before)
-    pf.space_after = Pt(after)
+    pf.space_before = SPACING_PT[before] if before in SPACING_PT else Pt(before)
+    pf.space_after = SPACING_PT[after] if after in SPACING_PT else Pt(after)
     if line_spacing:
         pf.line_spacing = Pt(line_spacing)
 
 
-def add_run_with_style(paragraph, text, bold=False, italic=False,
-                        font_name="Calibri", font_size=10, color=None):
-    """Add a styled run to a paragraph"""
-    run = paragraph.add_run(text)
-    run.bold = bold
-    run.italic = italic
-    run.font.name = font_name
-    run.font.size = Pt(font_size)
-    if color:
-        run.font.color.rgb = RGBColor(*color)
-    return run
+def add_resume_style(doc, name, font_size, color, bold=False, italic=False,
+                     base_style="Normal", style_type=WD_STYLE_TYPE.PARAGRAPH,
+                     font_name="Calibri"):
+    """Register a named style so paragraphs/runs pick up formatting without per-run setters"""
+    style = doc.styles.add_style(name, style_type)
+    if base_style:
+        style.base_style = doc.styles[base_style]
+    style.font.name = font_name
+    style.font.size = Pt(font_size)
+    style.font.color.rgb = color
+    style.font.bold = bold
+    style.font.italic = italic
+    return style
+
 
+def add_styled_paragraph(doc, text, style, before=0, after=0):
+    """Add a paragraph holding a single run of text in the given style"""
+    paragraph = doc.add_paragraph(text, style=style)
+    set_paragraph_spacing(paragraph, before=before, after=after)
+    return paragraph
 
-def generate_docx(resume_data: dict) -> bytes:
+
+def write_docx(resume_data: dict, out_stream) -> None:
     """
-    Generate a professionally formatted DOCX resume
-    Returns bytes of the DOCX file
+    Reference python-docx writer for the resume layout (the app serves write_docx_fast)
+    docx_template/ holds its package parts; tests check write_docx_fast against it
     """
     doc = Document()
     
     # ── Page Setup ──────────────────────────────────────────────────────────
     section = doc.sections[0]
-    section.top_margin = Inches(0.75)
-    section.bottom_margin = Inches(0.75)
-    section.left_margin = Inches(1.0)
-    section.right_margin = Inches(1.0)
-    
-    # ── Color Constants ──────────────────────────────────────────────────────
-    COLOR_HEADING = RGBColor(0x1A, 0x3A, 0x6B)   # Dark professional blue
-    COLOR_SUBHEADING = RGBColor(0x2C, 0x2C, 0x2C) # Near black
-    COLOR_BODY = RGBColor(0x33, 0x33, 0x33)        # Dark gray
-    COLOR_META = RGBColor(0x55, 0x55, 0x55)        # Medium gray
+    section.top_margin = PAGE_MARGIN_VERTICAL
+    section.bottom_margin = PAGE_MARGIN_VERTICAL
+    section.left_margin = PAGE_MARGIN_HORIZONTAL
+    section.right_margin = PAGE_MARGIN_HORIZONTAL
     
-    FONT_NAME = "Calibri"
+    # ── Styles ───────────────────────────────────────────────────────────────
+    style = add_resume_style(doc, "ResumeName", 20, COLOR_HEADING, bold=True)
+    style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    style = add_resume_style(doc, "ResumeContact", 9, COLOR_META)
+    style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    add_resume_style(doc, "ResumeSectionHeader", 11, COLOR_HEADING, bold=True)
+    add_resume_style(doc, "ResumeBody", 10, COLOR_BODY)
+    add_resume_style(doc, "ResumeSkills", 9.5, COLOR_BODY)
+    add_resume_style(doc, "ResumeSubheading", 10, COLOR_SUBHEADING)
+    add_resume_style(doc, "ResumeJobHeader", 10.5, COLOR_SUBHEADING, bold=True)
+    add_resume_style(doc, "ResumeDates", 9.5, COLOR_META, italic=True)
+    add_resume_style(doc, "ResumeMeta", 10, COLOR_META,
+                     base_style=None, style_type=WD_STYLE_TYPE.CHARACTER)
+    style = add_resume_style(doc, "ResumeBullet", 10, COLOR_BODY, base_style="List Bullet")
+    style.paragraph_format.left_indent = BULLET_LEFT_INDENT
+    style.paragraph_format.first_line_indent = BULLET_FIRST_LINE_INDENT
+    style.paragraph_format.space_before = SPACING_PT[1]
+    style.paragraph_format.space_after = SPACING_PT[1]
     
     name = resume_data.get("name", "Your Name")
     contact = resume_data.get("contact", {})
@@ -82,80 +166,40 @@ def generate_docx(resume_data: dict) -> bytes:
     certifications = resume_data.get("certifications", "")
     
     # ── NAME ─────────────────────────────────────────────────────────────────
-    name_para = doc.add_paragraph()
-    name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    set_paragraph_spacing(name_para, before=0, after=4)
-    name_run = name_para.add_run(name.upper() if name else "YOUR NAME")
-    name_run.bold = True
-    name_run.font.name = FONT_NAME
-    name_run.font.size = Pt(20)
-    name_run.font.color.rgb = COLOR_HEADING
+    add_styled_paragraph(doc, name.upper() if name else "YOUR NAME", "ResumeName", before=0, after=4)
     
     # ── CONTACT INFO ──────────────────────────────────────────────────────────
-    contact_parts = []
-    if contact.get("email"):
-        contact_parts.append(contact["email"])
-    if contact.get("phone"):
-        contact_parts.append(contact["phone"])
-    if contact.get("location"):
-        contact_parts.append(contact["location"])
-    if contact.get("linkedin"):
-        contact_parts.append(contact["linkedin"])
-    if contact.get("github"):
-        contact_parts.append(contact["github"])
-    
+    contact_parts = contact_items(contact)
     if contact_parts:
-        contact_para = doc.add_paragraph()
-        contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        set_paragraph_spacing(contact_para, before=2, after=8)
-        contact_run = contact_para.add_run(" | ".join(contact_parts))
-        contact_run.font.name = FONT_NAME
-        contact_run.font.size = Pt(9)
-        contact_run.font.color.rgb = COLOR_META
+        add_styled_paragraph(doc, " | ".join(contact_parts), "ResumeContact", before=2, after=8)
     
     def add_section_header(doc, title):
         """Add a formatted section header with underline"""
-        p = doc.add_paragraph()
-        set_paragraph_spacing(p, before=10, after=3)
-        run = p.add_run(title.upper())
-        run.bold = True
-        run.font.name = FONT_NAME
-        run.font.size = Pt(11)
-        run.font.color.rgb = COLOR_HEADING
+        p = add_styled_paragraph(doc, title.upper(), "ResumeSectionHeader", before=10, after=3)
         add_horizontal_line(p)
         return p
     
+    def add_bullet(doc, text):
+        """Add a bullet point (indent/spacing come from the ResumeBullet style)"""
+        return doc.add_paragraph(text, style="ResumeBullet")
+    
     # ── PROFESSIONAL SUMMARY ──────────────────────────────────────────────────
     if summary:
-        add_section_header(doc, "Professional Summary")
-        sum_para = doc.add_paragraph()
-        set_paragraph_spacing(sum_para, before=3, after=3)
-        sum_para.paragraph_format.first_line_indent = Inches(0)
-        sum_run = sum_para.add_run(summary)
-        sum_run.font.name = FONT_NAME
-        sum_run.font.size = Pt(10)
-        sum_run.font.color.rgb = COLOR_BODY
+        add_section_header(doc, SECTION_TITLES["summary"])
+        sum_para = add_styled_paragraph(doc, summary, "ResumeBody", before=3, after=3)
+        sum_para.paragraph_format.first_line_indent = NO_INDENT
     
     # ── SKILLS ───────────────────────────────────────────────────────────────
     if skills:
-        add_section_header(doc, "Core Competencies & Technical Skills")
-        
-        # Organize skills in rows of ~4 skills each
-        skills_para = doc.add_paragraph()
-        set_paragraph_spacing(skills_para, before=3, after=3)
+        add_section_header(doc, SECTION_TITLES["skills"])
         
         # Format as: "Python • React • Node.js • AWS • Docker"
-        # Group into rows of ~6-8 per line
+        # Group into rows of ~6-8 per line, all in a single run
         chunk_size = 6
-        for i in range(0, len(skills), chunk_size):
-            chunk = skills[i:i+chunk_size]
-            line = " • ".join(chunk)
-            if i + chunk_size < len(skills):
-                line += "\n"
-            run = skills_para.add_run(line)
-            run.font.name = FONT_NAME
-            run.font.size = Pt(9.5)
-            run.font.color.rgb = COLOR_BODY
+        skills_text = "\n".join(
+            " • ".join(skills[i:i+chunk_size]) for i in range(0, len(skills), chunk_size)
+        )
+        add_styled_paragraph(doc, skills_text, "ResumeSkills", before=3, after=3)
     
     # ── PROFESSIONAL EXPERIENCE ───────────────────────────────────────────────
     has_experience = (
@@ -164,21 +208,14 @@ def generate_docx(resume_data: dict) -> bytes:
     )
     
     if has_experience:
-        add_section_header(doc, "Professional Experience")
+        add_section_header(doc, SECTION_TITLES["experience"])
         
-        if experience and isinstance(experience, list) and len(experience) > 0:
+        if experience and isinstance(experience, list):
             # We have structured experience entries
-            for entry in experience:
-                company = entry.get("company", "")
-                role = entry.get("role", "")
-                dates = entry.get("dates", "")
-                location = entry.get("location", "")
-                bullets = entry.get("bullets", [])
-                raw = entry.get("raw", "")
-                
+            for company, role, dates, location, bullets, raw in map(ExperienceEntry.from_dict, experience):
                 # Company / Role header line
                 if company or role or raw:
-                    job_para = doc.add_paragraph()
+                    job_para = doc.add_paragraph(style="ResumeJobHeader")
                     set_paragraph_spacing(job_para, before=6, after=1)
                     
                     display_line = ""
@@ -192,40 +229,19 @@ def generate_docx(resume_data: dict) -> bytes:
                         display_line = raw[:100]
                     
                     if display_line:
-                        run = job_para.add_run(display_line)
-                        run.bold = True
-                        run.font.name = FONT_NAME
-                        run.font.size = Pt(10.5)
-                        run.font.color.rgb = COLOR_SUBHEADING
+                        job_para.add_run(display_line)
                     
                     if location:
-                        run = job_para.add_run(f" | {location}")
-                        run.font.name = FONT_NAME
-                        run.font.size = Pt(10)
-                        run.font.color.rgb = COLOR_META
+                        job_para.add_run(f" | {location}", style="ResumeMeta")
                 
                 # Dates line
                 if dates:
-                    dates_para = doc.add_paragraph()
-                    set_paragraph_spacing(dates_para, before=0, after=2)
-                    run = dates_para.add_run(dates)
-                    run.italic = True
-                    run.font.name = FONT_NAME
-                    run.font.size = Pt(9.5)
-                    run.font.color.rgb = COLOR_META
+                    add_styled_paragraph(doc, dates, "ResumeDates", before=0, after=2)
                 
                 # Bullet points
                 for bullet in bullets:
                     if bullet.strip():
-                        bullet_para = doc.add_paragraph(style='List Bullet')
-                        bullet_para.paragraph_format.left_indent = Inches(0.25)
-                        bullet_para.paragraph_format.first_line_indent = Inches(-0.2)
-                        set_paragraph_spacing(bullet_para, before=1, after=1)
-                        
-                        run = bullet_para.add_run(bullet.strip())
-                        run.font.name = FONT_NAME
-                        run.font.size = Pt(10)
-                        run.font.color.rgb = COLOR_BODY
+                        add_bullet(doc, bullet.strip())
         
         else:
             # Fallback: render raw experience text
@@ -236,93 +252,270 @@ def generate_docx(resume_data: dict) -> bytes:
                     if not line:
                         continue
                     
-                    is_bullet = line.startswith(('•', '-', '–', '●', '*'))
-                    is_date = bool(re.search(r'\d{4}', line))
+                    is_bullet = line[:1] in BULLET_CHARS
+                    is_date = YEAR_PATTERN.search(line) is not None
                     
                     if is_bullet:
-                        p = doc.add_paragraph(style='List Bullet')
-                        p.paragraph_format.left_indent = Inches(0.25)
-                        p.paragraph_format.first_line_indent = Inches(-0.2)
-                        set_paragraph_spacing(p, before=1, after=1)
-                        clean_line = re.sub(r'^[•\-–●\*·▪]\s*', '', line)
-                        run = p.add_run(clean_line)
-                        run.font.name = FONT_NAME
-                        run.font.size = Pt(10)
-                        run.font.color.rgb = COLOR_BODY
+                        clean_line = line[1:].lstrip()
+                        add_bullet(doc, clean_line)
                     else:
-                        p = doc.add_paragraph()
-                        set_paragraph_spacing(p, before=4, after=1)
-                        run = p.add_run(line)
-                        run.bold = is_date
-                        run.font.name = FONT_NAME
-                        run.font.size = Pt(10 if not is_date else 10.5)
-                        run.font.color.rgb = COLOR_SUBHEADING if not is_date else COLOR_SUBHEADING
+                        line_style = "ResumeJobHeader" if is_date else "ResumeSubheading"
+                        add_styled_paragraph(doc, line, line_style, before=4, after=1)
     
     # ── EDUCATION ─────────────────────────────────────────────────────────────
     if education:
-        add_section_header(doc, "Education")
+        add_section_header(doc, SECTION_TITLES["education"])
         for line in education.split('\n'):
             line = line.strip()
             if line:
-                p = doc.add_paragraph()
-                set_paragraph_spacing(p, before=2, after=2)
-                is_degree = any(kw in line.lower() for kw in
-                                ['bachelor', 'master', 'phd', 'b.s.', 'm.s.', 'degree', 'diploma'])
-                run = p.add_run(line)
-                run.bold = is_degree
-                run.font.name = FONT_NAME
-                run.font.size = Pt(10)
-                run.font.color.rgb = COLOR_SUBHEADING if is_degree else COLOR_BODY
+                is_degree = DEGREE_PATTERN.search(line) is not None
+                if is_degree:
+                    p = doc.add_paragraph(style="ResumeSubheading")
+                    p.add_run(line).bold = True
+                    set_paragraph_spacing(p, before=2, after=2)
+                else:
+                    add_styled_paragraph(doc, line, "ResumeBody", before=2, after=2)
     
     # ── PROJECTS ─────────────────────────────────────────────────────────────
     if projects:
-        add_section_header(doc, "Key Projects")
+        add_section_header(doc, SECTION_TITLES["projects"])
         for line in projects.split('\n'):
             line = line.strip()
             if not line:
                 continue
-            is_bullet = line.startswith(('•', '-', '–', '●', '*'))
+            is_bullet = line[:1] in BULLET_CHARS
             if is_bullet:
-                p = doc.add_paragraph(style='List Bullet')
-                p.paragraph_format.left_indent = Inches(0.25)
-                p.paragraph_format.first_line_indent = Inches(-0.2)
-                set_paragraph_spacing(p, before=1, after=1)
-                clean_line = re.sub(r'^[•\-–●\*·▪]\s*', '', line)
-                run = p.add_run(clean_line)
+                clean_line = line[1:].lstrip()
+                add_bullet(doc, clean_line)
             else:
-                p = doc.add_paragraph()
+                p = doc.add_paragraph(style="ResumeBody")
                 set_paragraph_spacing(p, before=4, after=1)
-                run = p.add_run(line)
-                run.bold = True
-            run.font.name = FONT_NAME
-            run.font.size = Pt(10)
-            run.font.color.rgb = COLOR_BODY
+                p.add_run(line).bold = True
     
     # ── CERTIFICATIONS ────────────────────────────────────────────────────────
     if certifications:
-        add_section_header(doc, "Certifications & Credentials")
+        add_section_header(doc, SECTION_TITLES["certifications"])
         for line in certifications.split('\n'):
             line = line.strip()
             if not line:
                 continue
-            is_bullet = line.startswith(('•', '-', '–'))
+            is_bullet = line[:1] in CERT_BULLET_CHARS
             if is_bullet:
-                p = doc.add_paragraph(style='List Bullet')
-                p.paragraph_format.left_indent = Inches(0.25)
-                p.paragraph_format.first_line_indent = Inches(-0.2)
-                set_paragraph_spacing(p, before=1, after=1)
-                clean_line = re.sub(r'^[•\-–●\*·▪]\s*', '', line)
-                run = p.add_run(clean_line)
+                clean_line = line[1:].lstrip()
+                add_bullet(doc, clean_line)
             else:
-                p = doc.add_paragraph()
-                set_paragraph_spacing(p, before=2, after=2)
-                run = p.add_run(line)
-            run.font.name = FONT_NAME
-            run.font.size = Pt(10)
-            run.font.color.rgb = COLOR_BODY
+                add_styled_paragraph(doc, line, "ResumeBody", before=2, after=2)
+    
+    # ── Save to stream ─────────────────────────────────────────────────────────
+    doc.save(out_stream)
+
+
+# ─── Direct OXML Writer ──────────────────────────────────────────────────────
+# Same layout as write_docx, but the package parts are static files in
+# docx_template/ and only word/document.xml is rendered per request.
+# tests/test_docx_generator.py keeps the two writers' paragraphs in step.
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "docx_template")
+DOCUMENT_TEMPLATE_NAME = "document.xml.tmpl"
+
+
+def _load_template_parts(template_dir: str) -> dict:
+    """Read every static package part once, keyed by its path inside the ZIP"""
+    parts = {}
+    for root, _dirs, files in os.walk(template_dir):
+        for filename in files:
+            path = os.path.join(root, filename)
+            part_name = os.path.relpath(path, template_dir).replace(os.sep, "/")
+            with open(path, "rb") as f:
+                parts[part_name] = f.read()
+    return parts
+
+
+TEMPLATE_PARTS = _load_template_parts(TEMPLATE_DIR)
+DOCUMENT_TEMPLATE = TEMPLATE_PARTS.pop(DOCUMENT_TEMPLATE_NAME).decode("utf-8")
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+# Characters XML 1.0 cannot hold (python-docx rejects them too)
+INVALID_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+RUN_BREAK_PATTERN = re.compile(r'(\t|\r\n|\n|\r)')
+HORIZONTAL_LINE_PPR = (
+    '<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="2C3E7A"/></w:pBdr>'
+)
+BOLD_RPR = '<w:rPr><w:b/></w:rPr>'
+META_RPR = '<w:rPr><w:rStyle w:val="ResumeMeta"/></w:rPr>'
+
+
+def _run_xml(text: str, rpr: str = "") -> str:
+    """One <w:r>, turning tabs/newlines into <w:tab/>/<w:br/> like python-docx does"""
+    parts = []
+    for piece in RUN_BREAK_PATTERN.split(INVALID_XML_CHARS.sub("", text)):
+        if piece == "\t":
+            parts.append("<w:tab/>")
+        elif piece in ("\n", "\r", "\r\n"):
+            parts.append("<w:br/>")
+        elif piece:
+            parts.append(f'<w:t xml:space="preserve">{xml_escape(piece)}</w:t>')
+    return f"<w:r>{rpr}{''.join(parts)}</w:r>"
+
+
+def _paragraph_xml(runs: str, style: str, before=None, after=None, extra_ppr: str = "",
+                   border: str = "") -> str:
+    """
+    One <w:p>; spacing is in points (stored as twentieths of a point)
+    pPr children follow the CT_PPr order: pStyle, pBdr, spacing, then extra_ppr (ind, jc...)
+    """
+    spacing = ""
+    if before is not None:
+        spacing = f'<w:spacing w:before="{round(before * 20)}" w:after="{round(after * 20)}"/>'
+    return f'<w:p><w:pPr><w:pStyle w:val="{style}"/>{border}{spacing}{extra_ppr}</w:pPr>{runs}</w:p>'
+
+
+def _styled_paragraph_xml(text: str, style: str, before=0, after=0, extra_ppr: str = "",
+                          border: str = "") -> str:
+    """Counterpart of add_styled_paragraph"""
+    return _paragraph_xml(_run_xml(text) if text else "", style, before, after, extra_ppr, border)
+
+
+def _bullet_xml(text: str) -> str:
+    """Counterpart of add_bullet - indent/spacing come from the ResumeBullet style"""
+    return _paragraph_xml(_run_xml(text) if text else "", "ResumeBullet")
+
+
+def _section_header_xml(title: str) -> str:
+    return _styled_paragraph_xml(title.upper(), "ResumeSectionHeader", before=10, after=3,
+                                 border=HORIZONTAL_LINE_PPR)
+
+
+def build_document_body(resume_data: dict) -> str:
+    """Render the <w:body> paragraphs for a resume (mirrors write_docx)"""
+    body = []
+    add = body.append
+    
+    name = resume_data.get("name", "Your Name")
+    contact = resume_data.get("contact", {})
+    summary = resume_data.get("summary", "")
+    skills = resume_data.get("skills", [])
+    experience = resume_data.get("experience", [])
+    education = resume_data.get("education", "")
+    projects = resume_data.get("projects", "")
+    certifications = resume_data.get("certifications", "")
+    
+    # ── NAME / CONTACT ───────────────────────────────────────────────────────
+    add(_styled_paragraph_xml(name.upper() if name else "YOUR NAME", "ResumeName", before=0, after=4))
+    
+    contact_parts = contact_items(contact)
+    if contact_parts:
+        add(_styled_paragraph_xml(" | ".join(contact_parts), "ResumeContact", before=2, after=8))
+    
+    # ── PROFESSIONAL SUMMARY ──────────────────────────────────────────────────
+    if summary:
+        add(_section_header_xml(SECTION_TITLES["summary"]))
+        add(_styled_paragraph_xml(summary, "ResumeBody", before=3, after=3,
+                                  extra_ppr='<w:ind w:firstLine="0"/>'))
     
-    # ── Save to bytes ──────────────────────────────────────────────────────────
+    # ── SKILLS ───────────────────────────────────────────────────────────────
+    if skills:
+        add(_section_header_xml(SECTION_TITLES["skills"]))
+        chunk_size = 6
+        skills_text = "\n".join(
+            " • ".join(skills[i:i+chunk_size]) for i in range(0, len(skills), chunk_size)
+        )
+        add(_styled_paragraph_xml(skills_text, "ResumeSkills", before=3, after=3))
+    
+    # ── PROFESSIONAL EXPERIENCE ───────────────────────────────────────────────
+    if experience or resume_data.get("experience_raw", ""):
+        add(_section_header_xml(SECTION_TITLES["experience"]))
+        
+        if experience and isinstance(experience, list):
+            for company, role, dates, location, bullets, raw in map(ExperienceEntry.from_dict, experience):
+                if company or role or raw:
+                    display_line = ""
+                    if company and role:
+                        display_line = f"{company} — {role}"
+                    elif company:
+                        display_line = company
+                    elif role:
+                        display_line = role
+                    elif raw:
+                        display_line = raw[:100]
+                    
+                    runs = _run_xml(display_line) if display_line else ""
+                    if location:
+                        runs += _run_xml(f" | {location}", META_RPR)
+                    add(_paragraph_xml(runs, "ResumeJobHeader", before=6, after=1))
+                
+                if dates:
+                    add(_styled_paragraph_xml(dates, "ResumeDates", before=0, after=2))
+                
+                for bullet in bullets:
+                    if bullet.strip():
+                        add(_bullet_xml(bullet.strip()))
+        
+        else:
+            for line in resume_data.get("experience_raw", "").split('\n'):
+                line = line.strip()
+                if not line:
+                    continue
+                if line[:1] in BULLET_CHARS:
+                    add(_bullet_xml(line[1:].lstrip()))
+                else:
+                    line_style = "ResumeJobHeader" if YEAR_PATTERN.search(line) else "ResumeSubheading"
+                    add(_styled_paragraph_xml(line, line_style, before=4, after=1))
+    
+    # ── EDUCATION ─────────────────────────────────────────────────────────────
+    if education:
+        add(_section_header_xml(SECTION_TITLES["education"]))
+        for line in education.split('\n'):
+            line = line.strip()
+            if line:
+                if DEGREE_PATTERN.search(line):
+                    add(_paragraph_xml(_run_xml(line, BOLD_RPR), "ResumeSubheading", before=2, after=2))
+                else:
+                    add(_styled_paragraph_xml(line, "ResumeBody", before=2, after=2))
+    
+    # ── PROJECTS ─────────────────────────────────────────────────────────────
+    if projects:
+        add(_section_header_xml(SECTION_TITLES["projects"]))
+        for line in projects.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            if line[:1] in BULLET_CHARS:
+                add(_bullet_xml(line[1:].lstrip()))
+            else:
+                add(_paragraph_xml(_run_xml(line, BOLD_RPR), "ResumeBody", before=4, after=1))
+    
+    # ── CERTIFICATIONS ────────────────────────────────────────────────────────
+    if certifications:
+        add(_section_header_xml(SECTION_TITLES["certifications"]))
+        for line in certifications.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            if line[:1] in CERT_BULLET_CHARS:
+                add(_bullet_xml(line[1:].lstrip()))
+            else:
+                add(_styled_paragraph_xml(line, "ResumeBody", before=2, after=2))
+    
+    return "".join(body)
+
+
+def write_docx_fast(resume_data: dict, out_stream) -> None:
+    """
+    Generate the resume DOCX without building a python-docx object tree
+    Static parts are copied from docx_template/; only document.xml is rendered
+    """
+    document_xml = DOCUMENT_TEMPLATE.replace("{body}", build_document_body(resume_data))
+    with zipfile.ZipFile(out_stream, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr(CONTENT_TYPES_PART, TEMPLATE_PARTS[CONTENT_TYPES_PART])
+        for part_name, data in TEMPLATE_PARTS.items():
+            if part_name != CONTENT_TYPES_PART:
+                package.writestr(part_name, data)
+        package.writestr("word/document.xml", document_xml.encode("utf-8"))
+
+
+def generate_docx_fast(resume_data: dict) -> bytes:
+    """Generate the resume DOCX; returns bytes of the DOCX file"""
     buffer = io.BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer.read()
+    write_docx_fast(resume_data, buffer)
+    return buffer.getvalue()
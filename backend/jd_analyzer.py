@@ -5,12 +5,23 @@ No external AI APIs - pure algorithmic intelligence
 """
 
 import re
+import sys
 import math
+import copy
 from collections import Counter
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from typing import Iterator
 from skills_db import SKILLS_DB, ALL_SKILLS, STRONG_VERBS, ATS_PHRASES
 
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator - fall back to the regex matchers
+    ahocorasick = None
+
 # ─── Stopwords ─────────────────────────────────────────────────────────────
-STOPWORDS = {
+STOPWORDS = frozenset({
     "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
     "of", "with", "by", "from", "as", "is", "was", "are", "were", "be",
     "been", "being", "have", "has", "had", "do", "does", "did", "will",
@@ -22,7 +33,7 @@ STOPWORDS = {
     "not", "only", "own", "same", "than", "too", "very", "just", "about",
     "above", "after", "against", "also", "between", "during", "into",
     "through", "while", "within", "without", "including", "across"
-}
+})
 
 # ─── Experience Level Detection ─────────────────────────────────────────────
 EXPERIENCE_LEVELS = {
@@ -36,6 +47,145 @@ EXPERIENCE_LEVELS = {
                    "chief", "executive", "c-level", "manager"]
 }
 
+LEVEL_NAMES = {
+    "entry": "junior",
+    "mid": "mid-level",
+    "senior": "senior",
+    "executive": "executive/director"
+}
+
+# "N-M years" / "N+ years" / "minimum N years" / "at least N years" in one scan.
+# Zero-width so matches overlap; the named group tells which form hit.
+YEAR_PATTERN = re.compile(
+    r'(?=(?:\d+\+?\s*(?:to|-)\s*(?P<range>\d+)\s*years?'
+    r'|(?P<plus>\d+)\+\s*years?'
+    r'|minimum\s+(?P<min>\d+)\s+years?'
+    r'|at\s+least\s+(?P<atleast>\d+)\s+years?))'
+)
+YEAR_PRIORITY = {"range": 0, "plus": 1, "min": 2, "atleast": 3}
+
+# Level keywords in priority order - where two start at the same spot the
+# higher-priority level wins the alternation
+LEVEL_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for kws in EXPERIENCE_LEVELS.values() for kw in kws) + '))'
+)
+KEYWORD_LEVEL = {}
+for _level, _keywords in EXPERIENCE_LEVELS.items():
+    for _kw in _keywords:
+        KEYWORD_LEVEL.setdefault(_kw, _level)
+LEVEL_PRIORITY = {level: i for i, level in enumerate(EXPERIENCE_LEVELS)}
+
+# ─── JD Section Detection ───────────────────────────────────────────────────
+# Applied to the lowercased JD, so a section runs until the next line that
+# starts with a letter - no IGNORECASE needed
+RESPONSIBILITIES_PATTERN = re.compile(
+    r'(?:responsibilities|what you.ll do|role responsibilities|key responsibilities|'
+    r'duties|your role|job duties|what we.re looking for you to do)(.*?)(?=\n[a-z]|\Z)',
+    re.DOTALL
+)
+REQUIREMENTS_PATTERN = re.compile(
+    r'(?:requirements|qualifications|what you.ll need|what we need|'
+    r'skills required|required skills|minimum qualifications|you have)(.*?)(?=\n[a-z]|\Z)',
+    re.DOTALL
+)
+
+# Additional common JD verbs
+JD_VERBS = [
+    "design", "develop", "build", "create", "implement", "deploy",
+    "manage", "lead", "collaborate", "analyze", "optimize", "maintain",
+    "architect", "establish", "drive", "deliver", "scale", "improve",
+    "integrate", "automate", "monitor", "troubleshoot", "review"
+]
+
+
+# ─── Precompiled Matchers ───────────────────────────────────────────────────
+def _compile_union(terms) -> re.Pattern:
+    """
+    Compile terms into one whole-word alternation (longest first).
+    The lookahead makes matches overlap so every start position is tried.
+    """
+    alternation = '|'.join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    return re.compile(r'(?=\b(' + alternation + r')\b)')
+
+
+def _prefix_terms(terms) -> dict:
+    """
+    Map each term to itself plus every shorter term that ends on a word
+    boundary inside it - those match at the same position but lose the
+    alternation to the longer term.
+    """
+    word = re.compile(r'\w')
+    return {
+        t: [t] + [o for o in terms
+                  if len(o) < len(t) and t.startswith(o)
+                  and bool(word.match(t[len(o) - 1])) != bool(word.match(t[len(o)]))]
+        for t in terms
+    }
+
+
+def _find_terms(matcher: tuple, text_lower: str) -> set:
+    """Run a (pattern, prefixes) matcher once over text, return every whole-word hit"""
+    pattern, prefixes = matcher
+    hits = set()
+    for term in set(pattern.findall(text_lower)):
+        hits.update(prefixes[term])
+    return hits
+
+
+# (category, original skill names, lowered skill names) - lowered once at import,
+# interned so they are the same objects as skills_db's ALL_SKILLS / SKILL_DOMAINS keys
+SKILLS_LOWERED = tuple(
+    (category, tuple(skills), tuple(sys.intern(s.lower()) for s in skills))
+    for category, skills in SKILLS_DB.items()
+)
+
+SKILL_MATCHERS = {}
+for _category, _skills, _lowered in SKILLS_LOWERED:
+    _terms = set(_lowered)
+    SKILL_MATCHERS[_category] = (_compile_union(_terms), _prefix_terms(_terms))
+
+WORD_CHAR = re.compile(r'\w')
+
+# A run of the characters clean_text keeps, minus leading/trailing dots
+TOKEN_PATTERN = re.compile(r'[\w\-\+\#](?:[\w\-\+\#\.]*[\w\-\+\#])?')
+
+
+def _is_word_boundary(text: str, i: int) -> bool:
+    """Same test as a regex word boundary at index i"""
+    before = i > 0 and WORD_CHAR.match(text, i - 1) is not None
+    after = i < len(text) and WORD_CHAR.match(text, i) is not None
+    return before != after
+
+
+# One automaton over every skill term - reports all (overlapping) hits in a
+# single pass over the text regardless of taxonomy size
+SKILL_AUTOMATON = None
+if ahocorasick is not None:
+    SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _category, _skills, _lowered in SKILLS_LOWERED:
+        for _skill in _lowered:
+            SKILL_AUTOMATON.add_word(_skill, _skill)
+    SKILL_AUTOMATON.make_automaton()
+
+
+def _skill_hits(text_lower: str, categories) -> set:
+    """Every whole-word skill term in text (at least those from the given categories)"""
+    hits = set()
+    if SKILL_AUTOMATON is not None:
+        for end, term in SKILL_AUTOMATON.iter(text_lower):
+            start = end - len(term) + 1
+            if _is_word_boundary(text_lower, start) and _is_word_boundary(text_lower, end + 1):
+                hits.add(term)
+        return hits
+    
+    for category in categories:
+        hits |= _find_terms(SKILL_MATCHERS[category], text_lower)
+    return hits
+
+
+ACTION_VERBS = {v.lower() for verbs in STRONG_VERBS.values() for v in verbs} | set(JD_VERBS)
+VERB_PATTERN = re.compile(r'\b(' + '|'.join(sorted(ACTION_VERBS, key=len, reverse=True)) + r')\b')
+
 
 def clean_text(text: str) -> str:
     """Clean and normalize text"""
@@ -51,29 +201,29 @@ def tokenize(text: str) -> list:
     return [w.strip('.,;:()[]{}') for w in words if w.strip('.,;:()[]{}')]
 
 
-def extract_ngrams(tokens: list, n: int) -> list:
-    """Extract n-grams from tokens"""
-    return [' '.join(tokens[i:i+n]) for i in range(len(tokens)-n+1)]
+def extract_ngrams(tokens: list, n: int) -> Iterator[str]:
+    """Extract n-grams from tokens (lazily - wrap in list() if needed)"""
+    return (' '.join(gram) for gram in zip(*(tokens[i:] for i in range(n))))
 
 
 def compute_tfidf(text: str, corpus_size: int = 100) -> dict:
     """Compute TF-IDF scores for words in text"""
-    tokens = tokenize(clean_text(text))
-    filtered = [t for t in tokens if t not in STOPWORDS and len(t) > 2]
+    # Same tokens as tokenize(clean_text(text)), in one regex pass
+    filtered = [t for t in TOKEN_PATTERN.findall(text.lower())
+                if len(t) > 2 and t not in STOPWORDS]
     
     # Term frequency
     tf = Counter(filtered)
-    total = len(filtered)
+    inv_total = 1.0 / max(len(filtered), 1)
+    log_corpus = math.log(corpus_size)
     
-    scores = {}
-    for word, count in tf.items():
-        # TF * IDF (approximate IDF based on common word lists)
-        tf_score = count / max(total, 1)
-        # Higher IDF for less common words (technical terms)
-        idf = math.log(corpus_size / (1 + tf.get(word, 0)))
-        scores[word] = tf_score * idf
-    
-    return scores
+    # TF * IDF (approximate IDF - higher for less common words, i.e. technical terms).
+    # The score only depends on the count, so compute it once per distinct count.
+    count_scores = {
+        count: (count * inv_total) * (log_corpus - math.log(1 + count))
+        for count in set(tf.values())
+    }
+    return {word: count_scores[count] for word, count in tf.items()}
 
 
 def extract_skills_from_text(text: str) -> dict:
@@ -84,13 +234,12 @@ def extract_skills_from_text(text: str) -> dict:
     text_lower = text.lower()
     found_skills = {}
     
-    for category, skills in SKILLS_DB.items():
-        matched = []
-        for skill in skills:
-            # Match whole word/phrase
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                matched.append(skill)
+    hits = _skill_hits(text_lower, SKILLS_DB)
+    if not hits:
+        return found_skills
+    
+    for category, skills, lowered in SKILLS_LOWERED:
+        matched = [skill for skill, skill_lower in zip(skills, lowered) if skill_lower in hits]
         if matched:
             found_skills[category] = matched
     
@@ -102,95 +251,64 @@ def extract_experience_level(text: str) -> str:
     text_lower = text.lower()
     
     # Check for year ranges first
-    year_patterns = [
-        (r'(\d+)\+?\s*(?:to|-)\s*(\d+)\s*years?', 'range'),
-        (r'(\d+)\+\s*years?', 'plus'),
-        (r'minimum\s+(\d+)\s+years?', 'min'),
-        (r'at\s+least\s+(\d+)\s+years?', 'atleast'),
-    ]
+    best = None
+    for m in YEAR_PATTERN.finditer(text_lower):
+        priority = YEAR_PRIORITY[m.lastgroup]
+        if best is None or priority < best[0]:
+            best = (priority, int(m.group(m.lastgroup)))
+            if priority == 0:
+                break
     
-    for pattern, ptype in year_patterns:
-        m = re.search(pattern, text_lower)
-        if m:
-            if ptype == 'range':
-                years = int(m.group(2))
-            elif ptype in ['plus', 'min', 'atleast']:
-                years = int(m.group(1))
-            else:
-                years = int(m.group(1))
-            
-            if years <= 2:
-                return "junior"
-            elif years <= 5:
-                return "mid-level"
-            elif years <= 8:
-                return "senior"
-            else:
-                return "staff/principal"
+    if best:
+        years = best[1]
+        if years <= 2:
+            return "junior"
+        elif years <= 5:
+            return "mid-level"
+        elif years <= 8:
+            return "senior"
+        else:
+            return "staff/principal"
     
     # Check keyword-based level
-    for level, keywords in EXPERIENCE_LEVELS.items():
-        for kw in keywords:
-            if kw in text_lower:
-                level_map = {
-                    "entry": "junior",
-                    "mid": "mid-level", 
-                    "senior": "senior",
-                    "executive": "executive/director"
-                }
-                return level_map.get(level, "mid-level")
+    best_level = None
+    for kw in LEVEL_PATTERN.findall(text_lower):
+        level = KEYWORD_LEVEL[kw]
+        if best_level is None or LEVEL_PRIORITY[level] < LEVEL_PRIORITY[best_level]:
+            best_level = level
+    
+    if best_level:
+        return LEVEL_NAMES[best_level]
     
     return "mid-level"  # Default
 
 
 def extract_action_verbs(text: str) -> list:
     """Extract action verbs from JD (responsibilities section)"""
-    all_verbs = []
-    for verbs in STRONG_VERBS.values():
-        all_verbs.extend([v.lower() for v in verbs])
-    
-    # Additional common JD verbs
-    jd_verbs = [
-        "design", "develop", "build", "create", "implement", "deploy",
-        "manage", "lead", "collaborate", "analyze", "optimize", "maintain",
-        "architect", "establish", "drive", "deliver", "scale", "improve",
-        "integrate", "automate", "monitor", "troubleshoot", "review"
-    ]
-    all_verbs.extend(jd_verbs)
-    
-    text_lower = text.lower()
-    found = []
-    for verb in set(all_verbs):
-        if re.search(r'\b' + verb + r'\b', text_lower):
-            found.append(verb.capitalize())
-    
-    return list(set(found))[:20]
+    # Dedup keeping first-appearance order, so the cap of 20 is deterministic
+    hits = dict.fromkeys(VERB_PATTERN.findall(text.lower()))
+    return [verb.capitalize() for verb in list(hits)[:20]]
 
 
 def extract_top_keywords(text: str, top_n: int = 20) -> list:
     """Extract top keywords using TF-IDF, excluding skills (handled separately)"""
     scores = compute_tfidf(text)
     
-    # Filter out stopwords and very short words
-    filtered = {
-        word: score for word, score in scores.items()
-        if word not in STOPWORDS and len(word) > 3
-    }
-    
-    # Sort by score
-    sorted_kw = sorted(filtered.items(), key=lambda x: x[1], reverse=True)
-    return [kw for kw, _ in sorted_kw[:top_n]]
+    # Filter out stopwords and very short words, then partial-sort by score
+    top = nlargest(
+        top_n,
+        ((word, score) for word, score in scores.items()
+         if len(word) > 3 and word not in STOPWORDS),
+        key=itemgetter(1)
+    )
+    return [kw for kw, _ in top]
 
 
 def extract_soft_skills(text: str) -> list:
     """Extract soft skills from JD"""
     soft_skills = SKILLS_DB.get("soft_skills", [])
-    text_lower = text.lower()
-    found = []
-    for skill in soft_skills:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
-            found.append(skill)
-    return found
+    hits = _skill_hits(text.lower(), ["soft_skills"])
+    return [skill for skill in soft_skills if skill in hits]
 
 
 def detect_industry_domain(text: str, skills: dict) -> str:
@@ -233,34 +351,15 @@ def extract_requirements_sections(text: str) -> dict:
         "about_company": ""
     }
     
-    # Section detection patterns
-    resp_patterns = [
-        r'(?:responsibilities|what you.ll do|role responsibilities|key responsibilities|'
-        r'duties|your role|job duties|what we.re looking for you to do)(.*?)(?=\n[A-Z]|\Z)',
-    ]
-    
-    req_patterns = [
-        r'(?:requirements|qualifications|what you.ll need|what we need|'
-        r'skills required|required skills|minimum qualifications|you have)(.*?)(?=\n[A-Z]|\Z)',
-    ]
-    
-    nice_patterns = [
-        r'(?:nice to have|preferred|bonus|plus|desired|would be great)(.*?)(?=\n[A-Z]|\Z)',
-    ]
-    
     text_lower = text.lower()
     
-    for pattern in resp_patterns:
-        m = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-        if m:
-            sections["responsibilities"] = m.group(1).strip()[:2000]
-            break
+    m = RESPONSIBILITIES_PATTERN.search(text_lower)
+    if m:
+        sections["responsibilities"] = m.group(1).strip()[:2000]
     
-    for pattern in req_patterns:
-        m = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-        if m:
-            sections["requirements"] = m.group(1).strip()[:2000]
-            break
+    m = REQUIREMENTS_PATTERN.search(text_lower)
+    if m:
+        sections["requirements"] = m.group(1).strip()[:2000]
     
     return sections
 
@@ -273,6 +372,15 @@ def analyze_jd(jd_text: str) -> dict:
     if not jd_text or len(jd_text.strip()) < 50:
         return {}
     
+    # The same JD is re-analyzed on every optimize - serve repeats from cache,
+    # copied so callers can't mutate the cached result
+    return copy.deepcopy(_analyze_jd_cached(jd_text))
+
+
+@lru_cache(maxsize=128)
+def _analyze_jd_cached(jd_text: str) -> dict:
+    """Run all extractors over a JD (memoized on the JD text)"""
+    
     # Extract all components
     skills = extract_skills_from_text(jd_text)
     experience_level = extract_experience_level(jd_text)
@@ -5,21 +5,115 @@ All endpoints for the web application
 
 import os
 import io
+import copy
+import re
+import asyncio
 import json
+import time
+import shutil
+import pathlib
+import tempfile
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import threading
 import traceback
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import partial
 from typing import Optional
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse, JSONResponse, ORJSONResponse
+from starlette.background import BackgroundTask
+from starlette.datastructures import Headers
+from pydantic import BaseModel, Field
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib import colors
+from reportlab.platypus import SimpleDocTemplate, Paragraph, HRFlowable
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 
 from resume_parser import parse_resume
 from jd_analyzer import analyze_jd
 from optimizer import optimize_resume, calculate_ats_score
-from docx_generator import generate_docx
+from docx_generator import write_docx_fast, contact_items, SECTION_TITLES
 
-app = FastAPI(title="Resume Optimizer API", version="2.0")
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+# orjson serializes the large /optimize payloads much faster than stdlib json
+APIResponse = ORJSONResponse if orjson is not None else JSONResponse
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the /optimize worker and the PDF renderers, and tear them down on shutdown"""
+    app.state.optimize_queue = asyncio.Queue()
+    app.state.optimize_worker = asyncio.create_task(optimize_worker(app.state.optimize_queue))
+    if LIBREOFFICE:
+        # One private LibreOffice profile per concurrent conversion, handed out through a queue
+        app.state.libreoffice_profiles = asyncio.Queue()
+        for _ in range(LIBREOFFICE_WORKERS):
+            app.state.libreoffice_profiles.put_nowait(tempfile.mkdtemp(prefix="resume-lo-"))
+    else:
+        app.state.pdf_pool = ProcessPoolExecutor(
+            max_workers=PDF_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_pdf_worker,
+        )
+        # Spawned children only start when a job arrives - submit a no-op per worker so
+        # they start (and run init_pdf_worker) now rather than inside the first request
+        for _ in range(PDF_PROCESS_WORKERS):
+            app.state.pdf_pool.submit(int)
+    try:
+        yield
+    finally:
+        app.state.optimize_worker.cancel()
+        if LIBREOFFICE:
+            profiles = app.state.libreoffice_profiles
+            while not profiles.empty():
+                shutil.rmtree(profiles.get_nowait(), ignore_errors=True)
+        else:
+            app.state.pdf_pool.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(title="Resume Optimizer API", version="2.0", default_response_class=APIResponse,
+              lifespan=lifespan)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Refuse uploads whose Content-Length is already over the limit, before the
+    multipart body is read. Chunked uploads without the header are still
+    capped by read_upload. Plain ASGI so every other request (health probes
+    included) passes straight through without a per-request wrapper.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in UPLOAD_PATHS:
+            content_length = Headers(scope=scope).get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_REQUEST_BYTES:
+                # Same status/shape as read_upload's rejection, which the UI already shows
+                response = APIResponse(status_code=400, content={"detail": "File too large (max 10MB)"})
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+# Added before CORS so CORSMiddleware wraps it and the rejection keeps its CORS headers
+app.add_middleware(UploadSizeLimitMiddleware)
 
 # Allow all origins for local use
 app.add_middleware(
@@ -31,18 +125,287 @@ app.add_middleware(
 )
 
 
+# /optimize returns the full editor HTML + resume JSON; gzip it for slow links
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+# DOCX (a ZIP) and PDF are already deflated; GZipMiddleware passes through
+# responses that set their own Content-Encoding
+NO_GZIP_HEADERS = {"Content-Encoding": "identity"}
+
+# ─── HTML/PDF Line Classification ────────────────────────────────────────────
+BULLET_STRIP_PATTERN = re.compile(r'^[•\-–●\*·▪]\s*')
+YEAR_TAIL_PATTERN = re.compile(r'\d{4}.*')
+YEAR_PATTERN = re.compile(r'\d{4}')
+EXPERIENCE_BULLET_PREFIXES = ('•', '-', '–', '●', '*')
+BULLET_PREFIXES = ('•', '-', '–')
+DEGREE_PATTERN = re.compile(r'bachelor|master|phd|b\.s\.|m\.s\.|degree|diploma', re.IGNORECASE)
+# The PDF export has never bolded diploma lines
+PDF_DEGREE_PATTERN = re.compile(r'bachelor|master|phd|b\.s\.|m\.s\.|degree', re.IGNORECASE)
+
+# ─── Shared HTML/PDF Builders ────────────────────────────────────────────────
+# Same output as html.escape(text, quote=True), in one C-level pass
+HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+LINE_BULLET = "bullet"
+LINE_DATE = "date"
+LINE_TEXT = "text"
+SKILLS_PER_ROW = 6
+
+
+def esc(text) -> str:
+    """HTML-escape text for the editor markup (empty string for falsy values)"""
+    if not text:
+        return ""
+    return (text if type(text) is str else str(text)).translate(HTML_ESCAPE_TABLE)
+
+
+# Upper-cased, markup-escaped titles - valid in both the editor HTML and reportlab markup
+SECTION_HEADERS = {key: esc(title.upper()) for key, title in SECTION_TITLES.items()}
+
+
+def contact_line(contact: dict, escape=str) -> str:
+    """Non-empty contact fields joined with " | " (empty string if none)"""
+    return " | ".join(map(escape, contact_items(contact)))
+
+
+def classify_lines(text: str, bullet_prefixes: tuple = BULLET_PREFIXES, detect_dates: bool = False) -> tuple:
+    """
+    Split a free-text section into (kind, text) pairs once for both renderers
+    Bullets lose their marker; dated lines are tagged only when detect_dates is set
+    """
+    lines = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith(bullet_prefixes):
+            lines.append((LINE_BULLET, BULLET_STRIP_PATTERN.sub('', line)))
+        elif detect_dates and YEAR_PATTERN.search(line):
+            lines.append((LINE_DATE, line))
+        else:
+            lines.append((LINE_TEXT, line))
+    return tuple(lines)
+
+
+def skill_rows(skills: list, separator: str, escape=str) -> list:
+    """Skills grouped into rows of SKILLS_PER_ROW, each row joined with separator"""
+    return [
+        separator.join(map(escape, skills[i:i + SKILLS_PER_ROW]))
+        for i in range(0, len(skills), SKILLS_PER_ROW)
+    ]
+
+
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB limit
+# Whole multipart request: the file plus boundaries and the other form fields
+MAX_UPLOAD_REQUEST_BYTES = MAX_UPLOAD_BYTES + 1024 * 1024
+UPLOAD_PATHS = frozenset({"/parse-resume", "/optimize"})
+UPLOAD_CHUNK_BYTES = 64 * 1024
+# Generated documents stay in memory up to this size, then spill to disk
+SPOOL_MAX_BYTES = 1024 * 1024
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# Uvicorn worker processes. Each worker imports this module separately, so the parse and
+# optimize caches and the PDF pools below are duplicated per worker - keep the default small
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", min(os.cpu_count() or 1, 4)))
+
+# PDFs come from reportlab unless LIBREOFFICE_PDF=1 opts in to converting the DOCX with
+# headless LibreOffice (different layout, and a cold soffice start per conversion)
+LIBREOFFICE_PDF = os.environ.get("LIBREOFFICE_PDF") == "1"
+LIBREOFFICE = (shutil.which("soffice") or shutil.which("libreoffice")) if LIBREOFFICE_PDF else None
+# Concurrent soffice conversions per uvicorn worker; each one is a full office process
+LIBREOFFICE_WORKERS = int(os.environ.get("LIBREOFFICE_WORKERS", 2))
+LIBREOFFICE_TIMEOUT = 60  # seconds
+# reportlab layout is pure Python and holds the GIL - run it in worker processes,
+# sharing the cores between uvicorn workers rather than spawning a full pool in each
+PDF_PROCESS_WORKERS = int(os.environ.get(
+    "PDF_PROCESS_WORKERS", max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY)))
+
+
+async def read_upload(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> bytes:
+    """
+    Read an upload in chunks, rejecting it as soon as it passes max_bytes
+    instead of buffering the whole body first
+    """
+    buffer = io.BytesIO()
+    total = 0
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > max_bytes:
+            raise HTTPException(status_code=400, detail="File too large (max 10MB)")
+        buffer.write(chunk)
+    return buffer.getvalue()
+
+
+async def spool_document(writer, resume_data: dict):
+    """Run writer(resume_data, file) in a worker thread into a spooled temp file"""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    try:
+        await asyncio.to_thread(writer, resume_data, spool)
+    except Exception:
+        spool.close()
+        raise
+    return spool
+
+
+def iter_file(f, chunk_size: int = DOWNLOAD_CHUNK_BYTES):
+    """
+    Yield a file from the start in chunks, closing it once exhausted
+    Responses also close it in a BackgroundTask, for bodies that are never iterated
+    """
+    try:
+        f.seek(0)
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        f.close()
+
+
+def write_pdf_libreoffice(resume_data: dict, out_stream, profile_dir: str) -> None:
+    """
+    Convert the generated DOCX to PDF with headless LibreOffice
+    profile_dir must not be shared by concurrent conversions
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        docx_path = os.path.join(work_dir, "resume.docx")
+        with open(docx_path, "wb") as f:
+            write_docx_fast(resume_data, f)
+        subprocess.run(
+            [LIBREOFFICE, f"-env:UserInstallation={pathlib.Path(profile_dir).as_uri()}",
+             "--headless", "--convert-to", "pdf", "--outdir", work_dir, docx_path],
+            check=True, capture_output=True, timeout=LIBREOFFICE_TIMEOUT,
+        )
+        with open(os.path.join(work_dir, "resume.pdf"), "rb") as f:
+            shutil.copyfileobj(f, out_stream)
+
+
 class OptimizeRequest(BaseModel):
     jd_text: str
     resume_json: Optional[dict] = None
 
 
+class AnalyzeJDRequest(BaseModel):
+    jd_text: str = ""
+
+
 class ResumeSections(BaseModel):
-    resume_data: dict
+    # Defaults keep "missing" on the endpoints' own 400 path (the UI shows detail as text)
+    resume_data: dict = Field(default_factory=dict)
+
+
+# Parsed uploads keyed by (content hash, file type), LRU bounded.
+# Filled from worker threads, hence the lock.
+PARSE_CACHE_SIZE = 128
+PARSEABLE_EXTENSIONS = ('.docx', '.pdf')
+parse_cache = OrderedDict()
+parse_cache_lock = threading.Lock()
+
+
+def parse_resume_cached(content: bytes, filename: str) -> dict:
+    """parse_resume, reusing the result for a byte-identical upload of the same type"""
+    filename_lower = filename.lower()
+    file_type = next((ext for ext in PARSEABLE_EXTENSIONS if filename_lower.endswith(ext)), filename_lower)
+    key = (hashlib.blake2b(content, digest_size=16).hexdigest(), file_type)
+    
+    with parse_cache_lock:
+        result = parse_cache.get(key)
+        if result is not None:
+            parse_cache.move_to_end(key)
+    
+    if result is None:
+        result = parse_resume(content, filename)
+        with parse_cache_lock:
+            parse_cache[key] = result
+            while len(parse_cache) > PARSE_CACHE_SIZE:
+                parse_cache.popitem(last=False)
+    
+    # Callers (and the optimizer) may mutate what they get back
+    return copy.deepcopy(result)
+
+
+# Finished /optimize results keyed by (jd hash, resume hash), LRU + TTL bounded
+OPTIMIZE_CACHE_SIZE = 256
+OPTIMIZE_CACHE_TTL = 900  # seconds
+optimize_cache = OrderedDict()
+
+
+def optimize_cache_key(jd_text: str, resume_data: dict) -> tuple:
+    resume_json = json.dumps(resume_data, sort_keys=True, default=str)
+    return (
+        hashlib.blake2b(jd_text.encode("utf-8")).hexdigest(),
+        hashlib.blake2b(resume_json.encode("utf-8")).hexdigest(),
+    )
+
+
+def get_cached_optimization(key: tuple):
+    """Cached (result, html) for key, or None if missing/expired"""
+    entry = optimize_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, outcome = entry
+    if expires_at < time.monotonic():
+        del optimize_cache[key]
+        return None
+    optimize_cache.move_to_end(key)
+    return outcome
+
+
+def store_optimization(key: tuple, outcome: tuple):
+    optimize_cache[key] = (time.monotonic() + OPTIMIZE_CACHE_TTL, outcome)
+    optimize_cache.move_to_end(key)
+    while len(optimize_cache) > OPTIMIZE_CACHE_SIZE:
+        optimize_cache.popitem(last=False)
+
+
+def run_optimization(jd_text: str, resume_data: dict) -> tuple:
+    """Analyze the JD, optimize the resume and build the editor HTML"""
+    jd_analysis = analyze_jd(jd_text)
+    result = optimize_resume(resume_data, jd_analysis)
+    # Build HTML representation for the editor
+    html = build_resume_html(result["optimized"])
+    return result, html
+
+
+async def optimize_worker(queue: asyncio.Queue):
+    """
+    Single consumer for /optimize jobs - keeps analyzer/optimizer state warm
+    on one thread and gives the endpoint natural backpressure
+    """
+    while True:
+        jd_text, resume_data, response = await queue.get()
+        try:
+            outcome = await asyncio.to_thread(run_optimization, jd_text, resume_data)
+        except Exception as e:
+            if not response.done():
+                response.set_exception(e)
+        else:
+            if not response.done():
+                response.set_result(outcome)
+        finally:
+            queue.task_done()
+
+
+def init_pdf_worker():
+    """Warm a PDF worker process (reportlab font metrics, module imports) before its first job"""
+    generate_pdf({"name": "warmup"})
+
+
+# Liveness probes hit this constantly - serialize the body once
+HEALTH_BODY = json.dumps({"status": "ok", "service": "Resume Optimizer API v2.0"}).encode("utf-8")
 
 
 @app.get("/health")
 async def health_check():
-    return {"status": "ok", "service": "Resume Optimizer API v2.0"}
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 @app.post("/parse-resume")
@@ -53,20 +416,17 @@ async def parse_resume_endpoint(file: UploadFile = File(...)):
     """
     try:
         filename = file.filename or "resume.docx"
-        content = await file.read()
+        content = await read_upload(file)
         
         if len(content) == 0:
             raise HTTPException(status_code=400, detail="Empty file uploaded")
         
-        if len(content) > 10 * 1024 * 1024:  # 10MB limit
-            raise HTTPException(status_code=400, detail="File too large (max 10MB)")
-        
-        result = parse_resume(content, filename)
+        result = await asyncio.to_thread(parse_resume_cached, content, filename)
         
         if "error" in result:
             raise HTTPException(status_code=422, detail=result["error"])
         
-        return JSONResponse(content={"success": True, "data": result})
+        return APIResponse(content={"success": True, "data": result})
         
     except HTTPException:
         raise
@@ -75,18 +435,18 @@ async def parse_resume_endpoint(file: UploadFile = File(...)):
 
 
 @app.post("/analyze-jd")
-async def analyze_jd_endpoint(body: dict):
+async def analyze_jd_endpoint(body: AnalyzeJDRequest):
     """
     Analyze a job description text
     Returns extracted skills, keywords, requirements
     """
     try:
-        jd_text = body.get("jd_text", "")
+        jd_text = body.jd_text
         if not jd_text or len(jd_text.strip()) < 50:
             raise HTTPException(status_code=400, detail="JD text too short")
         
-        analysis = analyze_jd(jd_text)
-        return JSONResponse(content={"success": True, "analysis": analysis})
+        analysis = await asyncio.to_thread(analyze_jd, jd_text)
+        return APIResponse(content={"success": True, "analysis": analysis})
         
     except HTTPException:
         raise
@@ -107,13 +467,13 @@ async def optimize_endpoint(
     try:
         # Parse resume
         if file and file.filename:
-            content = await file.read()
+            content = await read_upload(file)
             if len(content) == 0:
                 raise HTTPException(status_code=400, detail="Empty resume file")
-            resume_data = parse_resume(content, file.filename)
+            resume_data = await asyncio.to_thread(parse_resume_cached, content, file.filename)
         elif resume_json:
             try:
-                resume_data = json.loads(resume_json)
+                resume_data = json_loads(resume_json)
             except json.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="Invalid resume JSON")
         else:
@@ -122,16 +482,18 @@ async def optimize_endpoint(
         if not jd_text or len(jd_text.strip()) < 50:
             raise HTTPException(status_code=400, detail="JD text too short or empty")
         
-        # Analyze JD
-        jd_analysis = analyze_jd(jd_text)
-        
-        # Optimize
-        result = optimize_resume(resume_data, jd_analysis)
+        # Same JD + resume as a recent request → reuse its result
+        cache_key = optimize_cache_key(jd_text, resume_data)
+        outcome = get_cached_optimization(cache_key)
+        if outcome is None:
+            # Analyze JD + optimize on the shared worker
+            response = asyncio.get_running_loop().create_future()
+            await app.state.optimize_queue.put((jd_text, resume_data, response))
+            outcome = await response
+            store_optimization(cache_key, outcome)
+        result, html = outcome
         
-        # Build HTML representation for the editor
-        html = build_resume_html(result["optimized"])
-        
-        return JSONResponse(content={
+        return APIResponse(content={
             "success": True,
             "html": html,
             "optimized_data": result["optimized"],
@@ -155,25 +517,26 @@ async def optimize_endpoint(
 
 
 @app.post("/download-docx")
-async def download_docx(body: dict):
+async def download_docx(body: ResumeSections):
     """
     Generate and download DOCX from resume data or HTML
     """
     try:
-        resume_data = body.get("resume_data", {})
+        resume_data = body.resume_data
         
         if not resume_data:
             raise HTTPException(status_code=400, detail="No resume data provided")
         
-        docx_bytes = generate_docx(resume_data)
+        docx_file = await spool_document(write_docx_fast, resume_data)
         
         name = resume_data.get("name", "Resume").replace(" ", "_")
         filename = f"{name}_Optimized_Resume.docx"
         
         return StreamingResponse(
-            io.BytesIO(docx_bytes),
+            iter_file(docx_file),
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+            headers={"Content-Disposition": f'attachment; filename="{filename}"', **NO_GZIP_HEADERS},
+            background=BackgroundTask(docx_file.close),
         )
         
     except HTTPException:
@@ -183,26 +546,36 @@ async def download_docx(body: dict):
 
 
 @app.post("/download-pdf")
-async def download_pdf(body: dict):
+async def download_pdf(body: ResumeSections):
     """
     Generate PDF from resume data
     """
     try:
-        resume_data = body.get("resume_data", {})
+        resume_data = body.resume_data
         
         if not resume_data:
             raise HTTPException(status_code=400, detail="No resume data provided")
         
-        # First generate DOCX, then convert to PDF
-        pdf_bytes = generate_pdf(resume_data)
+        if LIBREOFFICE:
+            profile_dir = await app.state.libreoffice_profiles.get()
+            try:
+                pdf_file = await spool_document(
+                    partial(write_pdf_libreoffice, profile_dir=profile_dir), resume_data
+                )
+            finally:
+                app.state.libreoffice_profiles.put_nowait(profile_dir)
+        else:
+            loop = asyncio.get_running_loop()
+            pdf_file = io.BytesIO(await loop.run_in_executor(app.state.pdf_pool, generate_pdf, resume_data))
         
         name = resume_data.get("name", "Resume").replace(" ", "_")
         filename = f"{name}_Optimized_Resume.pdf"
         
         return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+            iter_file(pdf_file),
             media_type="application/pdf",
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+            headers={"Content-Disposition": f'attachment; filename="{filename}"', **NO_GZIP_HEADERS},
+            background=BackgroundTask(pdf_file.close),
         )
         
     except HTTPException:
@@ -215,14 +588,8 @@ def build_resume_html(resume_data: dict) -> str:
     """
     Build a clean Word-style HTML representation for the TipTap editor
     """
-    import html as html_lib
-    
-    def esc(text):
-        if not text:
-            return ""
-        return html_lib.escape(str(text))
-    
-    parts = []
+    buf = io.StringIO()
+    w = buf.write
     
     name = resume_data.get("name", "")
     contact = resume_data.get("contact", {})
@@ -236,35 +603,29 @@ def build_resume_html(resume_data: dict) -> str:
     
     # Name
     if name:
-        parts.append(f'<h1 class="resume-name">{esc(name.upper())}</h1>')
+        w(f'<h1 class="resume-name">{esc(name.upper())}</h1>\n')
     
     # Contact
-    contact_items = []
-    for key in ["email", "phone", "location", "linkedin", "github"]:
-        if contact.get(key):
-            contact_items.append(esc(contact[key]))
-    if contact_items:
-        parts.append(f'<p class="contact-line">{" | ".join(contact_items)}</p>')
+    contact_str = contact_line(contact, esc)
+    if contact_str:
+        w(f'<p class="contact-line">{contact_str}</p>\n')
     
     # Summary
     if summary:
-        parts.append('<h2 class="section-header">PROFESSIONAL SUMMARY</h2>')
-        parts.append(f'<p class="summary-text">{esc(summary)}</p>')
+        w(f'<h2 class="section-header">{SECTION_HEADERS["summary"]}</h2>\n')
+        w(f'<p class="summary-text">{esc(summary)}</p>\n')
     
     # Skills
     if skills:
-        parts.append('<h2 class="section-header">CORE COMPETENCIES &amp; TECHNICAL SKILLS</h2>')
+        w(f'<h2 class="section-header">{SECTION_HEADERS["skills"]}</h2>\n')
         # Group into rows of 6
-        rows = []
-        for i in range(0, len(skills), 6):
-            chunk = skills[i:i+6]
-            rows.append(" &bull; ".join([esc(s) for s in chunk]))
-        parts.append(f'<p class="skills-list">{"<br>".join(rows)}</p>')
+        rows = skill_rows(skills, " &bull; ", esc)
+        w(f'<p class="skills-list">{"<br>".join(rows)}</p>\n')
     
     # Experience
     has_experience = (experience and len(experience) > 0) or experience_raw
     if has_experience:
-        parts.append('<h2 class="section-header">PROFESSIONAL EXPERIENCE</h2>')
+        w(f'<h2 class="section-header">{SECTION_HEADERS["experience"]}</h2>\n')
         
         if experience and isinstance(experience, list) and len(experience) > 0:
             for entry in experience:
@@ -284,192 +645,171 @@ def build_resume_html(resume_data: dict) -> str:
                 elif role:
                     display_line = role
                 elif raw:
-                    import re
-                    clean_raw = re.sub(r'\d{4}.*', '', raw).strip()
+                    clean_raw = YEAR_TAIL_PATTERN.sub('', raw).strip()
                     display_line = esc(clean_raw[:80])
                 
                 if display_line:
                     loc_str = f" &nbsp;|&nbsp; {esc(location)}" if location else ""
-                    parts.append(f'<p class="job-header"><strong>{display_line}{loc_str}</strong></p>')
+                    w(f'<p class="job-header"><strong>{display_line}{loc_str}</strong></p>\n')
                 
                 if dates:
-                    parts.append(f'<p class="job-dates"><em>{esc(dates)}</em></p>')
+                    w(f'<p class="job-dates"><em>{esc(dates)}</em></p>\n')
                 
                 if bullets:
-                    parts.append('<ul class="job-bullets">')
+                    w('<ul class="job-bullets">\n')
                     for bullet in bullets:
                         if bullet.strip():
-                            parts.append(f'<li>{esc(bullet.strip())}</li>')
-                    parts.append('</ul>')
+                            w('<li>')
+                            w(esc(bullet.strip()))
+                            w('</li>\n')
+                    w('</ul>\n')
                 elif raw and not display_line:
-                    parts.append(f'<p class="job-raw">{esc(raw)}</p>')
+                    w(f'<p class="job-raw">{esc(raw)}</p>\n')
         
         elif experience_raw:
             # Render raw experience as structured HTML
-            import re
-            for line in experience_raw.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-                is_bullet = line.startswith(('•', '-', '–', '●', '*'))
-                if is_bullet:
-                    clean = re.sub(r'^[•\-–●\*·▪]\s*', '', line)
-                    parts.append(f'<ul class="job-bullets"><li>{esc(clean)}</li></ul>')
-                elif re.search(r'\d{4}', line):
-                    parts.append(f'<p class="job-dates"><em>{esc(line)}</em></p>')
+            for kind, line in classify_lines(experience_raw, EXPERIENCE_BULLET_PREFIXES, True):
+                if kind == LINE_BULLET:
+                    w(f'<ul class="job-bullets"><li>{esc(line)}</li></ul>\n')
+                elif kind == LINE_DATE:
+                    w(f'<p class="job-dates"><em>{esc(line)}</em></p>\n')
                 else:
-                    parts.append(f'<p class="job-header"><strong>{esc(line)}</strong></p>')
+                    w(f'<p class="job-header"><strong>{esc(line)}</strong></p>\n')
     
     # Education
     if education:
-        parts.append('<h2 class="section-header">EDUCATION</h2>')
-        import re
+        w(f'<h2 class="section-header">{SECTION_HEADERS["education"]}</h2>\n')
         for line in education.split('\n'):
             line = line.strip()
             if line:
-                is_degree = any(kw in line.lower() for kw in
-                                ['bachelor', 'master', 'phd', 'b.s.', 'm.s.', 'degree', 'diploma'])
+                is_degree = DEGREE_PATTERN.search(line) is not None
                 if is_degree:
-                    parts.append(f'<p class="edu-degree"><strong>{esc(line)}</strong></p>')
+                    w(f'<p class="edu-degree"><strong>{esc(line)}</strong></p>\n')
                 else:
-                    parts.append(f'<p class="edu-detail">{esc(line)}</p>')
+                    w(f'<p class="edu-detail">{esc(line)}</p>\n')
     
     # Projects
     if projects:
-        parts.append('<h2 class="section-header">KEY PROJECTS</h2>')
-        import re
-        for line in projects.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            is_bullet = line.startswith(('•', '-', '–'))
-            if is_bullet:
-                clean = re.sub(r'^[•\-–●\*·▪]\s*', '', line)
-                parts.append(f'<ul class="job-bullets"><li>{esc(clean)}</li></ul>')
+        w(f'<h2 class="section-header">{SECTION_HEADERS["projects"]}</h2>\n')
+        for kind, line in classify_lines(projects):
+            if kind == LINE_BULLET:
+                w(f'<ul class="job-bullets"><li>{esc(line)}</li></ul>\n')
             else:
-                parts.append(f'<p class="job-header"><strong>{esc(line)}</strong></p>')
+                w(f'<p class="job-header"><strong>{esc(line)}</strong></p>\n')
     
     # Certifications
     if certifications:
-        parts.append('<h2 class="section-header">CERTIFICATIONS &amp; CREDENTIALS</h2>')
-        import re
-        for line in certifications.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            is_bullet = line.startswith(('•', '-', '–'))
-            if is_bullet:
-                clean = re.sub(r'^[•\-–●\*·▪]\s*', '', line)
-                parts.append(f'<ul class="job-bullets"><li>{esc(clean)}</li></ul>')
+        w(f'<h2 class="section-header">{SECTION_HEADERS["certifications"]}</h2>\n')
+        for kind, line in classify_lines(certifications):
+            if kind == LINE_BULLET:
+                w(f'<ul class="job-bullets"><li>{esc(line)}</li></ul>\n')
             else:
-                parts.append(f'<p class="cert-item">{esc(line)}</p>')
+                w(f'<p class="cert-item">{esc(line)}</p>\n')
     
-    return '\n'.join(parts)
+    html = buf.getvalue()
+    # Fragments are newline-separated, not newline-terminated
+    return html[:-1] if html else html
 
 
-def generate_pdf(resume_data: dict) -> bytes:
-    """Generate PDF using reportlab with professional formatting"""
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable
-    from reportlab.platypus import ListFlowable, ListItem
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-    
-    buffer = io.BytesIO()
-    
-    # Page setup
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=letter,
-        leftMargin=1*inch,
-        rightMargin=1*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
-    
-    # Colors
-    DARK_BLUE = colors.HexColor('#1A3A6B')
-    NEAR_BLACK = colors.HexColor('#2C2C2C')
-    DARK_GRAY = colors.HexColor('#333333')
-    MED_GRAY = colors.HexColor('#555555')
-    
-    # Styles
-    styles = getSampleStyleSheet()
-    
-    style_name = ParagraphStyle(
+# ─── PDF Layout (built once, shared by every /download-pdf) ──────────────────
+PDF_PAGE_KWARGS = dict(
+    pagesize=letter,
+    leftMargin=1*inch,
+    rightMargin=1*inch,
+    topMargin=0.75*inch,
+    bottomMargin=0.75*inch
+)
+
+PDF_DARK_BLUE = colors.HexColor('#1A3A6B')
+PDF_NEAR_BLACK = colors.HexColor('#2C2C2C')
+PDF_DARK_GRAY = colors.HexColor('#333333')
+PDF_MED_GRAY = colors.HexColor('#555555')
+
+PDF_BASE_STYLE = getSampleStyleSheet()['Normal']
+
+PDF_STYLES = {
+    "name": ParagraphStyle(
         'ResumeName',
-        parent=styles['Normal'],
+        parent=PDF_BASE_STYLE,
         fontName='Helvetica-Bold',
         fontSize=18,
-        textColor=DARK_BLUE,
+        textColor=PDF_DARK_BLUE,
         alignment=TA_CENTER,
         spaceAfter=4
-    )
-    
-    style_contact = ParagraphStyle(
+    ),
+    "contact": ParagraphStyle(
         'Contact',
-        parent=styles['Normal'],
+        parent=PDF_BASE_STYLE,
         fontName='Helvetica',
         fontSize=9,
-        textColor=MED_GRAY,
+        textColor=PDF_MED_GRAY,
         alignment=TA_CENTER,
         spaceAfter=10
-    )
-    
-    style_section_header = ParagraphStyle(
+    ),
+    "section_header": ParagraphStyle(
         'SectionHeader',
-        parent=styles['Normal'],
+        parent=PDF_BASE_STYLE,
         fontName='Helvetica-Bold',
         fontSize=10.5,
-        textColor=DARK_BLUE,
+        textColor=PDF_DARK_BLUE,
         spaceBefore=10,
         spaceAfter=3
-    )
-    
-    style_body = ParagraphStyle(
+    ),
+    "body": ParagraphStyle(
         'ResumeBody',
-        parent=styles['Normal'],
+        parent=PDF_BASE_STYLE,
         fontName='Helvetica',
         fontSize=10,
-        textColor=DARK_GRAY,
+        textColor=PDF_DARK_GRAY,
         alignment=TA_JUSTIFY,
         spaceAfter=4
-    )
-    
-    style_job_header = ParagraphStyle(
+    ),
+    "job_header": ParagraphStyle(
         'JobHeader',
-        parent=styles['Normal'],
+        parent=PDF_BASE_STYLE,
         fontName='Helvetica-Bold',
         fontSize=10.5,
-        textColor=NEAR_BLACK,
+        textColor=PDF_NEAR_BLACK,
         spaceBefore=8,
         spaceAfter=1
-    )
-    
-    style_dates = ParagraphStyle(
+    ),
+    "dates": ParagraphStyle(
         'Dates',
-        parent=styles['Normal'],
+        parent=PDF_BASE_STYLE,
         fontName='Helvetica-Oblique',
         fontSize=9.5,
-        textColor=MED_GRAY,
+        textColor=PDF_MED_GRAY,
         spaceAfter=2
-    )
-    
-    style_bullet = ParagraphStyle(
+    ),
+    "bullet": ParagraphStyle(
         'Bullet',
-        parent=styles['Normal'],
+        parent=PDF_BASE_STYLE,
         fontName='Helvetica',
         fontSize=10,
-        textColor=DARK_GRAY,
+        textColor=PDF_DARK_GRAY,
         leftIndent=15,
         firstLineIndent=0,
         spaceAfter=2,
         bulletIndent=0
-    )
-    
-    # Story builder
+    ),
+}
+
+
+def generate_pdf(resume_data: dict) -> bytes:
+    """Generate PDF using reportlab with professional formatting"""
+    buffer = io.BytesIO()
+    write_pdf(resume_data, buffer)
+    return buffer.getvalue()
+
+
+def write_pdf(resume_data: dict, out_stream) -> None:
+    """Write the reportlab PDF straight into out_stream (any writable binary file object)"""
+    doc = SimpleDocTemplate(out_stream, **PDF_PAGE_KWARGS)
+    doc.build(build_pdf_story(resume_data))
+
+
+def build_pdf_story(resume_data: dict, styles: dict = PDF_STYLES) -> list:
+    """Flowables for the resume PDF"""
     story = []
     
     name = resume_data.get("name", "")
@@ -483,38 +823,34 @@ def generate_pdf(resume_data: dict) -> bytes:
     certifications = resume_data.get("certifications", "")
     
     def add_section_hr(story):
-        story.append(HRFlowable(width="100%", thickness=1.5, color=DARK_BLUE, spaceAfter=4))
+        story.append(HRFlowable(width="100%", thickness=1.5, color=PDF_DARK_BLUE, spaceAfter=4))
     
     # Name
     if name:
-        story.append(Paragraph(name.upper(), style_name))
+        story.append(Paragraph(name.upper(), styles["name"]))
     
     # Contact
-    contact_items = [contact.get(k, "") for k in ["email", "phone", "location", "linkedin", "github"]]
-    contact_str = " | ".join([c for c in contact_items if c])
+    contact_str = contact_line(contact)
     if contact_str:
-        story.append(Paragraph(contact_str, style_contact))
+        story.append(Paragraph(contact_str, styles["contact"]))
     
     # Summary
     if summary:
-        story.append(Paragraph("PROFESSIONAL SUMMARY", style_section_header))
+        story.append(Paragraph(SECTION_HEADERS["summary"], styles["section_header"]))
         add_section_hr(story)
-        story.append(Paragraph(summary, style_body))
+        story.append(Paragraph(summary, styles["body"]))
     
     # Skills
     if skills:
-        story.append(Paragraph("CORE COMPETENCIES &amp; TECHNICAL SKILLS", style_section_header))
+        story.append(Paragraph(SECTION_HEADERS["skills"], styles["section_header"]))
         add_section_hr(story)
-        rows = []
-        for i in range(0, len(skills), 6):
-            chunk = skills[i:i+6]
-            rows.append(" • ".join(chunk))
-        story.append(Paragraph("<br/>".join(rows), style_body))
+        rows = skill_rows(skills, " • ")
+        story.append(Paragraph("<br/>".join(rows), styles["body"]))
     
     # Experience
     has_experience = (experience and len(experience) > 0) or experience_raw
     if has_experience:
-        story.append(Paragraph("PROFESSIONAL EXPERIENCE", style_section_header))
+        story.append(Paragraph(SECTION_HEADERS["experience"], styles["section_header"]))
         add_section_hr(story)
         
         if experience and isinstance(experience, list):
@@ -533,82 +869,76 @@ def generate_pdf(resume_data: dict) -> bytes:
                 elif role:
                     display = f"<b>{role}</b>"
                 elif raw:
-                    import re
-                    clean_raw = re.sub(r'\d{4}.*', '', raw).strip()[:80]
+                    clean_raw = YEAR_TAIL_PATTERN.sub('', raw).strip()[:80]
                     display = f"<b>{clean_raw}</b>"
                 
                 if display:
-                    story.append(Paragraph(display, style_job_header))
+                    story.append(Paragraph(display, styles["job_header"]))
                 if dates:
-                    story.append(Paragraph(f"<i>{dates}</i>", style_dates))
+                    story.append(Paragraph(f"<i>{dates}</i>", styles["dates"]))
                 
                 for bullet in bullets:
                     if bullet.strip():
-                        story.append(Paragraph(f"• {bullet.strip()}", style_bullet))
+                        story.append(Paragraph(f"• {bullet.strip()}", styles["bullet"]))
         
         elif experience_raw:
-            import re
-            for line in experience_raw.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-                if line.startswith(('•', '-', '–')):
-                    clean = re.sub(r'^[•\-–●\*·▪]\s*', '', line)
-                    story.append(Paragraph(f"• {clean}", style_bullet))
-                elif re.search(r'\d{4}', line):
-                    story.append(Paragraph(f"<i>{line}</i>", style_dates))
+            for kind, line in classify_lines(experience_raw, BULLET_PREFIXES, True):
+                if kind == LINE_BULLET:
+                    story.append(Paragraph(f"• {line}", styles["bullet"]))
+                elif kind == LINE_DATE:
+                    story.append(Paragraph(f"<i>{line}</i>", styles["dates"]))
                 else:
-                    story.append(Paragraph(f"<b>{line}</b>", style_job_header))
+                    story.append(Paragraph(f"<b>{line}</b>", styles["job_header"]))
     
     # Education
     if education:
-        story.append(Paragraph("EDUCATION", style_section_header))
+        story.append(Paragraph(SECTION_HEADERS["education"], styles["section_header"]))
         add_section_hr(story)
         for line in education.split('\n'):
             line = line.strip()
             if line:
-                is_degree = any(kw in line.lower() for kw in
-                                ['bachelor', 'master', 'phd', 'b.s.', 'm.s.', 'degree'])
+                is_degree = PDF_DEGREE_PATTERN.search(line) is not None
                 if is_degree:
-                    story.append(Paragraph(f"<b>{line}</b>", style_body))
+                    story.append(Paragraph(f"<b>{line}</b>", styles["body"]))
                 else:
-                    story.append(Paragraph(line, style_body))
+                    story.append(Paragraph(line, styles["body"]))
     
     # Projects
     if projects:
-        story.append(Paragraph("KEY PROJECTS", style_section_header))
+        story.append(Paragraph(SECTION_HEADERS["projects"], styles["section_header"]))
         add_section_hr(story)
-        import re
-        for line in projects.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith(('•', '-', '–')):
-                clean = re.sub(r'^[•\-–●\*·▪]\s*', '', line)
-                story.append(Paragraph(f"• {clean}", style_bullet))
+        for kind, line in classify_lines(projects):
+            if kind == LINE_BULLET:
+                story.append(Paragraph(f"• {line}", styles["bullet"]))
             else:
-                story.append(Paragraph(f"<b>{line}</b>", style_job_header))
+                story.append(Paragraph(f"<b>{line}</b>", styles["job_header"]))
     
     # Certifications
     if certifications:
-        story.append(Paragraph("CERTIFICATIONS &amp; CREDENTIALS", style_section_header))
+        story.append(Paragraph(SECTION_HEADERS["certifications"], styles["section_header"]))
         add_section_hr(story)
-        import re
-        for line in certifications.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith(('•', '-', '–')):
-                clean = re.sub(r'^[•\-–●\*·▪]\s*', '', line)
-                story.append(Paragraph(f"• {clean}", style_bullet))
+        for kind, line in classify_lines(certifications):
+            if kind == LINE_BULLET:
+                story.append(Paragraph(f"• {line}", styles["bullet"]))
             else:
-                story.append(Paragraph(line, style_body))
+                story.append(Paragraph(line, styles["body"]))
     
-    doc.build(story)
-    buffer.seek(0)
-    return buffer.read()
+    return story
+
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=False)
+    # Workers get the "main:app" import string, so each one re-imports this module and serves
+    # its own app (startup, caches, pools); the app built in this __main__ process is not used
+    os.environ["WEB_CONCURRENCY"] = str(WEB_CONCURRENCY)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=WEB_CONCURRENCY,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        reload=False,
+    )
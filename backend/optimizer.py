@@ -6,12 +6,20 @@ Uses NLP patterns, skill taxonomy, verb libraries, and template intelligence
 
 import re
 import random
-from typing import Dict, List, Optional
+import zlib
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Optional, Set
 from skills_db import (
     VERB_UPGRADES, STRONG_VERBS, WEAK_VERBS,
-    ATS_PHRASES, ALL_SKILLS, SKILLS_DB
+    ATS_PHRASES, ALL_SKILLS, SKILL_DOMAINS
 )
 
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator - fall back to substring scans
+    ahocorasick = None
+
 # ─── ING → Past tense conversions for verb-phrase extraction ────────────────
 ING_TO_PAST = {
     "building": "Built", "developing": "Developed", "designing": "Designed",
@@ -29,7 +37,7 @@ ING_TO_PAST = {
 }
 
 # Smart weak-phrase → strong transformations (ORDER MATTERS: specific first)
-SMART_TRANSFORMS = [
+RAW_SMART_TRANSFORMS = [
     # "Was responsible for VERB-ING X" → "PAST-VERB X"
     (r'^was\s+responsible\s+for\s+(\w+ing)\s+(.+)',
      lambda m: f"{ING_TO_PAST.get(m.group(1).lower(), 'Managed')} {m.group(2)}"),
@@ -111,6 +119,46 @@ SMART_TRANSFORMS = [
      lambda m: f"Successfully {m.group(1)}"),
 ]
 
+# Compiled once; IGNORECASE lets the replacers read groups straight from the original text
+SMART_TRANSFORMS = [(re.compile(pattern, re.IGNORECASE), replacer)
+                    for pattern, replacer in RAW_SMART_TRANSFORMS]
+
+
+
+def _transforms_by_first_word(raw_transforms) -> Dict[str, "re.Pattern"]:
+    """
+    Every pattern starts with ^<literal word>, so bucket them by that word and
+    join each bucket into one anchored alternation. Alternatives keep list order,
+    so the first hit is the same transform the sequential scan would pick.
+    Each alternative is wrapped in (?P<tN>...) with N its SMART_TRANSFORMS index;
+    being outermost, it is the last group to close, so match.lastgroup names it.
+    """
+    buckets = {}
+    for i, (pattern, _) in enumerate(raw_transforms):
+        first_word = re.match(r'\^(\w+)', pattern).group(1)
+        buckets.setdefault(first_word, []).append(f'(?P<t{i}>{pattern[1:]})')
+    return {
+        word: re.compile('^(?:' + '|'.join(alternatives) + ')', re.IGNORECASE)
+        for word, alternatives in buckets.items()
+    }
+
+
+# "was" → combined pattern for the five "was ..." transforms, etc.
+SMART_TRANSFORMS_BY_FIRST_WORD = _transforms_by_first_word(RAW_SMART_TRANSFORMS)
+
+# Determiners that never start a proper noun
+LEADING_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'this', 'that', 'these', 'those', 'all',
+    'their', 'our', 'its', 'my', 'your', 'his', 'her'
+})
+
+# Tech names whose capitalization must survive at the start of a remainder
+PROPER_TECH_TERMS = frozenset({
+    'PostgreSQL', 'JavaScript', 'TypeScript', 'GitHub', 'MySQL',
+    'MongoDB', 'Redis', 'Docker', 'Kubernetes', 'React', 'Angular',
+    'Python', 'FastAPI', 'Django', 'Flask', 'AWS', 'Azure', 'GCP'
+})
+
 
 def smart_preserve_case(remainder: str) -> str:
     """
@@ -132,17 +180,12 @@ def smart_preserve_case(remainder: str) -> str:
     
     # If it's a proper noun starting with capital → keep it
     # (Heuristic: contains only letters, starts with capital, not a stop word)
-    stopwords = {'the', 'a', 'an', 'this', 'that', 'these', 'those', 'all',
-                 'their', 'our', 'its', 'my', 'your', 'his', 'her'}
     if (first_word[0].isupper() and 
-        first_word.lower() not in stopwords and
+        first_word.lower() not in LEADING_STOPWORDS and
         len(first_word) > 3 and
         first_word[1:].lower() == first_word[1:]):  # only first char is capital
         # Could be a proper noun - check if it's a tech term
-        tech_terms = {'PostgreSQL', 'JavaScript', 'TypeScript', 'GitHub', 'MySQL',
-                      'MongoDB', 'Redis', 'Docker', 'Kubernetes', 'React', 'Angular',
-                      'Python', 'FastAPI', 'Django', 'Flask', 'AWS', 'Azure', 'GCP'}
-        if first_word in tech_terms:
+        if first_word in PROPER_TECH_TERMS:
             return remainder
     
     # Default: lowercase first char
@@ -152,30 +195,80 @@ def smart_preserve_case(remainder: str) -> str:
 def apply_smart_transform(sentence: str) -> Optional[str]:
     """Try all smart transformations, return the best match"""
     sentence_stripped = sentence.strip()
-    sentence_lower = sentence_stripped.lower()
-    
-    for pattern, replacer in SMART_TRANSFORMS:
-        m = re.match(pattern, sentence_lower, re.IGNORECASE)
-        if m:
-            try:
-                result = replacer(m)
-                if result:
-                    # Now we need to restore original casing for the matched groups
-                    # Re-apply from original sentence
-                    original_m = re.match(pattern, sentence_stripped, re.IGNORECASE)
-                    if original_m:
-                        # Rebuild with original group content
-                        orig_result = replacer(original_m)
-                        if orig_result:
-                            # Capitalize first char
-                            return orig_result[0].upper() + orig_result[1:]
-                    return result[0].upper() + result[1:]
-            except Exception:
-                continue
     
-    return None
+    # Only the transforms whose leading keyword is this sentence's first word can match
+    words = sentence_stripped.split(None, 1)
+    combined = SMART_TRANSFORMS_BY_FIRST_WORD.get(words[0].lower()) if words else None
+    if combined is None:
+        return None
+    
+    hit = combined.match(sentence_stripped)
+    if not hit:
+        return None
+    
+    # Re-run just the winning pattern so the replacer sees its own group numbers;
+    # groups come from the original sentence, so inner casing is preserved.
+    # Every replacer already opens with a capitalized verb, so no re-casing here
+    pattern, replacer = SMART_TRANSFORMS[int(hit.lastgroup[1:])]
+    return replacer(pattern.match(sentence_stripped))
 
 
+# ─── Leading bullet glyphs stripped before verb replacement ─────────────────
+# Same set as the old r'^[•\-–●\*·▪\s]+' class: \s covers exactly the str.isspace() characters
+BULLET_LEAD_CHARS = (
+    "•-–●*·▪"
+    " \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004"
+    "\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# ─── Weak opening verbs: exact words plus 4-letter stems ─────────────────────
+WEAK_VERBS_EXACT = frozenset(WEAK_VERBS)
+# 'the'/'was'/'has' only count as exact words, never as stems
+WEAK_VERB_PREFIXES = frozenset(w[:4] for w in WEAK_VERBS if w not in ('the', 'was', 'has'))
+WEAK_VERB_PREFIX_LENGTHS = tuple(sorted({len(p) for p in WEAK_VERB_PREFIXES}))
+
+# ─── Strong-verb categories for weak-verb replacement ───────────────────────
+# Checked in priority order: the first category with any trigger substring wins
+VERB_CATEGORY_TRIGGERS = (
+    ("collaboration", ('team', 'cross', 'group', 'stakeholder', 'collaborate')),
+    ("development", ('build', 'develop', 'creat', 'code', 'implement',
+                     'deploy', 'architect', 'api', 'service', 'system')),
+    ("growth", ('increas', 'grow', 'generat', 'revenue', 'sale', 'boost')),
+    ("reduction", ('reduc', 'decreas', 'cut', 'lower', 'minim', 'remov')),
+    ("analysis", ('analyz', 'resear', 'assess', 'evaluat', 'investigat', 'diagnos')),
+    ("leadership", ('lead', 'manag', 'direct', 'mentor', 'supervis', 'overse')),
+    ("automation", ('automat', 'integrat', 'migrat', 'digit', 'transform')),
+    ("improvement", ('optimiz', 'improv', 'enhanc', 'streamlin', 'acceler')),
+)
+
+# One automaton over every trigger; each term maps to its category's priority
+VERB_CATEGORY_AUTOMATON = None
+if ahocorasick is not None:
+    VERB_CATEGORY_AUTOMATON = ahocorasick.Automaton()
+    for _priority, (_category, _terms) in enumerate(VERB_CATEGORY_TRIGGERS):
+        for _term in _terms:
+            if _term not in VERB_CATEGORY_AUTOMATON:
+                VERB_CATEGORY_AUTOMATON.add_word(_term, _priority)
+    VERB_CATEGORY_AUTOMATON.make_automaton()
+
+
+def verb_category(context_lower: str) -> str:
+    """STRONG_VERBS category for a lowercased bullet (defaults to development)"""
+    if VERB_CATEGORY_AUTOMATON is not None:
+        priority = min((p for _end, p in VERB_CATEGORY_AUTOMATON.iter(context_lower)), default=None)
+        return VERB_CATEGORY_TRIGGERS[priority][0] if priority is not None else "development"
+    for category, terms in VERB_CATEGORY_TRIGGERS:
+        if any(t in context_lower for t in terms):
+            return category
+    return "development"
+
+
+def stable_choice(options: list, key: str):
+    """Pick an option by a stable hash of key - the same bullet always gets the same verb"""
+    return options[zlib.crc32(key.encode("utf-8", "surrogatepass")) % len(options)]
+
+
+@lru_cache(maxsize=4096)
 def replace_weak_verb(sentence: str) -> str:
     """Replace weak opening verbs with strong action verbs - preserves inner capitalization"""
     sentence = sentence.strip()
@@ -183,7 +276,7 @@ def replace_weak_verb(sentence: str) -> str:
         return sentence
     
     # Remove leading bullet characters
-    clean = re.sub(r'^[•\-–●\*·▪\s]+', '', sentence).strip()
+    clean = sentence.lstrip(BULLET_LEAD_CHARS).strip()
     
     if not clean:
         return sentence
@@ -200,141 +293,191 @@ def replace_weak_verb(sentence: str) -> str:
     
     first_word_lower = words[0].lower()
     
-    for weak in WEAK_VERBS:
-        # Exact match or very close match (handles worked/working/works)
-        if (first_word_lower == weak or 
-            (len(first_word_lower) > 4 and first_word_lower.startswith(weak[:4]) and weak not in ('the', 'was', 'has'))):
-            
-            context_lower = clean.lower()
-            
-            if any(w in context_lower for w in ['team', 'cross', 'group', 'stakeholder', 'collaborate']):
-                new_verb = random.choice(STRONG_VERBS["collaboration"])
-            elif any(w in context_lower for w in ['build', 'develop', 'creat', 'code', 'implement', 
-                                                    'deploy', 'architect', 'api', 'service', 'system']):
-                new_verb = random.choice(STRONG_VERBS["development"])
-            elif any(w in context_lower for w in ['increas', 'grow', 'generat', 'revenue', 'sale', 'boost']):
-                new_verb = random.choice(STRONG_VERBS["growth"])
-            elif any(w in context_lower for w in ['reduc', 'decreas', 'cut', 'lower', 'minim', 'remov']):
-                new_verb = random.choice(STRONG_VERBS["reduction"])
-            elif any(w in context_lower for w in ['analyz', 'resear', 'assess', 'evaluat', 'investigat', 'diagnos']):
-                new_verb = random.choice(STRONG_VERBS["analysis"])
-            elif any(w in context_lower for w in ['lead', 'manag', 'direct', 'mentor', 'supervis', 'overse']):
-                new_verb = random.choice(STRONG_VERBS["leadership"])
-            elif any(w in context_lower for w in ['automat', 'integrat', 'migrat', 'digit', 'transform']):
-                new_verb = random.choice(STRONG_VERBS["automation"])
-            elif any(w in context_lower for w in ['optimiz', 'improv', 'enhanc', 'streamlin', 'acceler']):
-                new_verb = random.choice(STRONG_VERBS["improvement"])
-            else:
-                new_verb = random.choice(STRONG_VERBS["development"])
-            
-            # Keep remaining words WITH their original capitalization
-            rest = ' '.join(words[1:])
-            if rest:
-                return f"{new_verb} {rest}"
-            break
+    # Exact match or very close match (handles worked/working/works)
+    if (first_word_lower in WEAK_VERBS_EXACT or
+            (len(first_word_lower) > 4 and
+             any(first_word_lower[:n] in WEAK_VERB_PREFIXES for n in WEAK_VERB_PREFIX_LENGTHS))):
+        
+        new_verb = stable_choice(STRONG_VERBS[verb_category(clean.lower())], clean)
+        
+        # Keep remaining words WITH their original capitalization
+        rest = ' '.join(words[1:])
+        if rest:
+            return f"{new_verb} {rest}"
     
     return sentence
 
 
-def is_contextually_relevant(keyword: str, bullet: str) -> bool:
+# ─── Bullet technology domains ───────────────────────────────────────────────
+# Plain substring triggers (not whole words); a term can mark several domains
+BULLET_DOMAIN_TERMS = {
+    "frontend": ('frontend', 'front-end', 'ui', 'react', 'angular', 'vue', 'css', 'html', 'browser'),
+    "backend": ('api', 'backend', 'back-end', 'server', 'endpoint', 'microservice',
+                'python', 'node', 'flask', 'django', 'fastapi', 'express', 'spring'),
+    "data": ('database', 'data', 'query', 'sql', 'schema', 'table', 'index',
+             'postgresql', 'mysql', 'mongodb', 'redis', 'cache', 'store'),
+    "devops": ('deploy', 'pipeline', 'ci', 'cd', 'docker', 'kubernetes', 'container',
+               'infrastructure', 'cloud', 'aws', 'azure', 'gcp', 'server', 'host',
+               'terraform', 'helm', 'jenkins', 'github actions'),
+    "tech": ('develop', 'built', 'implemented', 'created', 'designed', 'engineered',
+             'architected', 'leveraged', 'utilized', 'configured', 'integrated'),
+}
+
+# One automaton over every trigger; each term maps to the domains it marks
+BULLET_DOMAIN_AUTOMATON = None
+if ahocorasick is not None:
+    _term_domains = {}
+    for _domain, _terms in BULLET_DOMAIN_TERMS.items():
+        for _term in _terms:
+            _term_domains.setdefault(_term, []).append(_domain)
+    BULLET_DOMAIN_AUTOMATON = ahocorasick.Automaton()
+    for _term, _domains in _term_domains.items():
+        BULLET_DOMAIN_AUTOMATON.add_word(_term, tuple(_domains))
+    BULLET_DOMAIN_AUTOMATON.make_automaton()
+
+
+@lru_cache(maxsize=2048)
+def classify_bullet(bullet_lower: str) -> frozenset:
+    """Domains with at least one trigger substring in the lowercased bullet (one scan, cached)"""
+    if BULLET_DOMAIN_AUTOMATON is not None:
+        domains = set()
+        for _end, term_domains in BULLET_DOMAIN_AUTOMATON.iter(bullet_lower):
+            domains.update(term_domains)
+        return frozenset(domains)
+    return frozenset(domain for domain, terms in BULLET_DOMAIN_TERMS.items()
+                     if any(t in bullet_lower for t in terms))
+
+
+# ─── Keyword families for relevance checks (exact lowercase keyword match) ───
+INFRA_KEYWORDS = frozenset([
+    'aws', 'azure', 'gcp', 'ec2', 's3', 'lambda', 'kubernetes', 'k8s',
+    'terraform', 'helm', 'nginx', 'ansible', 'fargate', 'ecs', 'eks',
+])
+CICD_KEYWORDS = frozenset(['ci/cd', 'github actions', 'jenkins', 'gitlab ci', 'circleci'])
+DATABASE_KEYWORDS = frozenset([
+    'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite',
+    'oracle', 'cassandra', 'dynamodb', 'influxdb', 'mariadb', 'couchdb',
+])
+FRONTEND_KEYWORDS = frozenset([
+    'react', 'angular', 'vue', 'svelte', 'next.js', 'nuxt.js',
+    'tailwind', 'bootstrap', 'css', 'html', 'typescript',
+])
+BACKEND_KEYWORDS = frozenset([
+    'fastapi', 'django', 'flask', 'spring', 'express', 'nestjs', 'gin',
+    'graphql', 'grpc', 'rest',
+])
+# Language keyword → substrings that show the bullet is in that language family
+LANGUAGE_TRIGGERS = {
+    'python': ('python', 'flask', 'django', 'fastapi'),
+    'javascript': ('javascript', 'node', 'react', 'express', 'js'),
+    'typescript': ('typescript', 'react', 'angular', 'nestjs', 'ts'),
+    'java': ('java', 'spring', 'maven', 'gradle'),
+    'go': ('golang', 'go ', 'gin', 'fiber'),
+}
+
+
+def is_contextually_relevant(keyword: str, bullet: str,
+                             bullet_lower: Optional[str] = None) -> bool:
     """
     Check if inserting this keyword makes semantic sense in this bullet.
     Strong relevance checks to avoid nonsensical insertions.
     """
     kw_lower = keyword.lower()
-    bullet_lower = bullet.lower()
+    if bullet_lower is None:
+        bullet_lower = bullet.lower()
     
     # Already present
     if kw_lower in bullet_lower:
         return False
     
     # Determine bullet's technology domain
-    bullet_is_frontend = any(t in bullet_lower for t in 
-                              ['frontend', 'front-end', 'ui', 'react', 'angular', 'vue', 'css', 'html', 'browser'])
-    bullet_is_backend = any(t in bullet_lower for t in
-                             ['api', 'backend', 'back-end', 'server', 'endpoint', 'microservice',
-                              'python', 'node', 'flask', 'django', 'fastapi', 'express', 'spring'])
-    bullet_is_data = any(t in bullet_lower for t in
-                          ['database', 'data', 'query', 'sql', 'schema', 'table', 'index',
-                           'postgresql', 'mysql', 'mongodb', 'redis', 'cache', 'store'])
-    bullet_is_devops = any(t in bullet_lower for t in
-                            ['deploy', 'pipeline', 'ci', 'cd', 'docker', 'kubernetes', 'container',
-                             'infrastructure', 'cloud', 'aws', 'azure', 'gcp', 'server', 'host',
-                             'terraform', 'helm', 'jenkins', 'github actions'])
-    bullet_is_tech = any(t in bullet_lower for t in
-                          ['develop', 'built', 'implemented', 'created', 'designed', 'engineered',
-                           'architected', 'leveraged', 'utilized', 'configured', 'integrated'])
+    domains = classify_bullet(bullet_lower)
+    bullet_is_frontend = "frontend" in domains
+    bullet_is_backend = "backend" in domains
+    bullet_is_data = "data" in domains
+    bullet_is_devops = "devops" in domains
+    bullet_is_tech = "tech" in domains
     
     # Cloud/infra keywords → ONLY in devops/infrastructure bullets
-    infra_kws = ['aws', 'azure', 'gcp', 'ec2', 's3', 'lambda', 'kubernetes', 'k8s',
-                 'terraform', 'helm', 'nginx', 'ansible', 'fargate', 'ecs', 'eks']
-    if kw_lower in infra_kws:
+    if kw_lower in INFRA_KEYWORDS:
         return bullet_is_devops
     
     # CI/CD keywords → pipeline/deployment bullets
-    if kw_lower in ['ci/cd', 'github actions', 'jenkins', 'gitlab ci', 'circleci']:
+    if kw_lower in CICD_KEYWORDS:
         return bullet_is_devops or 'pipeline' in bullet_lower or 'automat' in bullet_lower
     
     # Database keywords → data bullets only
-    db_kws = ['postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite', 
-               'oracle', 'cassandra', 'dynamodb', 'influxdb', 'mariadb', 'couchdb']
-    if kw_lower in db_kws:
+    if kw_lower in DATABASE_KEYWORDS:
         return bullet_is_data
     
     # Frontend frameworks → frontend bullets
-    frontend_kws = ['react', 'angular', 'vue', 'svelte', 'next.js', 'nuxt.js',
-                     'tailwind', 'bootstrap', 'css', 'html', 'typescript']
-    if kw_lower in frontend_kws:
+    if kw_lower in FRONTEND_KEYWORDS:
         return bullet_is_frontend or (bullet_is_tech and not bullet_is_data and not bullet_is_devops)
     
     # Backend frameworks → backend bullets
-    backend_kws = ['fastapi', 'django', 'flask', 'spring', 'express', 'nestjs', 'gin',
-                    'graphql', 'grpc', 'rest']
-    if kw_lower in backend_kws:
+    if kw_lower in BACKEND_KEYWORDS:
         return bullet_is_backend or (bullet_is_tech and not bullet_is_data and not bullet_is_devops)
     
     # Language keywords → only if same language family in bullet
-    lang_kws = {'python': ['python', 'flask', 'django', 'fastapi'],
-                 'javascript': ['javascript', 'node', 'react', 'express', 'js'],
-                 'typescript': ['typescript', 'react', 'angular', 'nestjs', 'ts'],
-                 'java': ['java', 'spring', 'maven', 'gradle'],
-                 'go': ['golang', 'go ', 'gin', 'fiber']}
-    for lang, lang_triggers in lang_kws.items():
-        if kw_lower == lang:
-            return any(t in bullet_lower for t in lang_triggers)
+    lang_triggers = LANGUAGE_TRIGGERS.get(kw_lower)
+    if lang_triggers is not None:
+        return any(t in bullet_lower for t in lang_triggers)
     
     # Generic tech insertions - only in clearly technical bullets
     return bullet_is_tech and len(keyword) > 3
 
 
-def insert_keyword_naturally(bullet: str, keyword: str) -> str:
+# ─── Action verbs deciding how a keyword is appended ────────────────────────
+# Checked in order; plain substrings, so "rebuilt" still counts as "built"
+BULLET_ACTION_TERMS = (
+    ("build", ('developed', 'built', 'implemented', 'created',
+               'designed', 'engineered', 'architected')),
+    ("optimize", ('optimized', 'improved', 'enhanced', 'streamlined')),
+    ("deploy", ('deployed', 'configured', 'containerized', 'migrated')),
+)
+
+
+@lru_cache(maxsize=2048)
+def bullet_action(bullet_lower: str) -> Optional[str]:
+    """First BULLET_ACTION_TERMS action found in the lowercased bullet (cached per bullet)"""
+    for action, terms in BULLET_ACTION_TERMS:
+        if any(t in bullet_lower for t in terms):
+            return action
+    return None
+
+
+@lru_cache(maxsize=4096)
+def insert_keyword_naturally(bullet: str, keyword: str,
+                             bullet_lower: Optional[str] = None) -> str:
     """Insert a JD keyword naturally into a bullet point - only if semantically appropriate"""
-    # Don't insert if keyword already present
-    if keyword.lower() in bullet.lower():
+    if bullet_lower is None:
+        bullet_lower = bullet.lower()
+    
+    # Don't insert if keyword already present (this also rules out any \b-anchored
+    # occurrence, so the branches below need no regex check of their own)
+    if keyword.lower() in bullet_lower:
         return bullet
     
     # Check semantic relevance first
-    if not is_contextually_relevant(keyword, bullet):
+    if not is_contextually_relevant(keyword, bullet, bullet_lower):
         return bullet
     
-    bullet_lower = bullet.lower()
+    action = bullet_action(bullet_lower)
     
     # Pattern: technical action verbs → add "using {keyword}"
-    if any(w in bullet_lower for w in ['developed', 'built', 'implemented', 'created', 
-                                         'designed', 'engineered', 'architected']):
-        if not re.search(r'\b' + re.escape(keyword.lower()), bullet_lower):
-            if bullet.rstrip().endswith('.'):
-                return bullet[:-1] + f", leveraging {keyword}."
-            return f"{bullet}, leveraging {keyword}"
+    if action == "build":
+        if bullet.rstrip().endswith('.'):
+            return bullet[:-1] + f", leveraging {keyword}."
+        return f"{bullet}, leveraging {keyword}"
     
     # Pattern: optimized/improved → add "leveraging {keyword}"
-    if any(w in bullet_lower for w in ['optimized', 'improved', 'enhanced', 'streamlined']):
+    if action == "optimize":
         if bullet.rstrip().endswith('.'):
             return bullet[:-1] + f" with {keyword}."
         return f"{bullet} with {keyword}"
     
     # Pattern: deployed/configured → add "on {keyword}" for cloud or "using {keyword}" for tools
-    if any(w in bullet_lower for w in ['deployed', 'configured', 'containerized', 'migrated']):
+    if action == "deploy":
         prep = "on" if keyword.lower() in ['aws', 'azure', 'gcp', 'eks', 'gke'] else "using"
         if bullet.rstrip().endswith('.'):
             return bullet[:-1] + f" {prep} {keyword}."
@@ -343,22 +486,40 @@ def insert_keyword_naturally(bullet: str, keyword: str) -> str:
     return bullet
 
 
-def calculate_ats_score(resume_data: dict, jd_analysis: dict) -> dict:
+def lower_jd_terms(jd_analysis: dict) -> dict:
+    """Lowercased technical_skills / soft_skills / keywords lists of a JD analysis"""
+    return {
+        field: [t.lower() for t in jd_analysis.get(field, [])]
+        for field in ("technical_skills", "soft_skills", "keywords")
+    }
+
+
+def calculate_ats_score(resume_data: dict, jd_analysis: dict,
+                        resume_text_lower: Optional[str] = None,
+                        jd_lower: Optional[dict] = None) -> dict:
     """
     Calculate ATS compatibility score (0-100)
     Returns score + breakdown
+    Callers that already hold the lowercased resume text / JD terms can pass them in
     """
     score = 0
     breakdown = {}
     
-    resume_text = resume_data.get("full_text", "").lower()
-    jd_tech_skills = [s.lower() for s in jd_analysis.get("technical_skills", [])]
-    jd_soft_skills = [s.lower() for s in jd_analysis.get("soft_skills", [])]
-    jd_keywords = [k.lower() for k in jd_analysis.get("keywords", [])]
+    if resume_text_lower is None:
+        resume_text_lower = resume_data.get("full_text", "").lower()
+    if jd_lower is None:
+        jd_lower = lower_jd_terms(jd_analysis)
+    resume_text = resume_text_lower
+    jd_tech_skills = jd_lower["technical_skills"]
+    jd_soft_skills = jd_lower["soft_skills"]
+    jd_keywords = jd_lower["keywords"]
+    
+    # One substring scan per distinct JD term; matched/missing below are set lookups
+    present = {term for term in {*jd_tech_skills, *jd_soft_skills, *jd_keywords} if term in resume_text}
     
     # 1. Technical Skills Match (40 points max)
     if jd_tech_skills:
-        matched_tech = [s for s in jd_tech_skills if s in resume_text]
+        matched_tech = [s for s in jd_tech_skills if s in present]
         tech_ratio = len(matched_tech) / len(jd_tech_skills)
         tech_score = int(tech_ratio * 40)
         score += tech_score
@@ -366,12 +527,12 @@ def calculate_ats_score(resume_data: dict, jd_analysis: dict) -> dict:
             "score": tech_score,
             "max": 40,
             "matched": matched_tech,
-            "missing": [s for s in jd_tech_skills if s not in resume_text]
+            "missing": [s for s in jd_tech_skills if s not in present]
         }
     
     # 2. Keyword Coverage (30 points max)
     if jd_keywords:
-        matched_kw = [k for k in jd_keywords if k in resume_text]
+        matched_kw = [k for k in jd_keywords if k in present]
         kw_ratio = len(matched_kw) / len(jd_keywords)
         kw_score = int(kw_ratio * 30)
         score += kw_score
@@ -379,12 +540,12 @@ def calculate_ats_score(resume_data: dict, jd_analysis: dict) -> dict:
             "score": kw_score,
             "max": 30,
             "matched": matched_kw[:10],
-            "missing": [k for k in jd_keywords if k not in resume_text][:10]
+            "missing": [k for k in jd_keywords if k not in present][:10]
         }
     
     # 3. Soft Skills (15 points max)
     if jd_soft_skills:
-        matched_soft = [s for s in jd_soft_skills if s in resume_text]
+        matched_soft = [s for s in jd_soft_skills if s in present]
         soft_ratio = len(matched_soft) / len(jd_soft_skills)
         soft_score = int(soft_ratio * 15)
         score += soft_score
@@ -416,7 +577,43 @@ def calculate_ats_score(resume_data: dict, jd_analysis: dict) -> dict:
     }
 
 
-def rewrite_summary(resume_data: dict, jd_analysis: dict) -> str:
+# Domain-specific summary templates (built once; filled with str.format per resume)
+SUMMARY_TEMPLATES = {
+    "Software Engineering": [
+        "{soft} software engineer {exp} specializing in {skills}. "
+        "Proven track record of designing and delivering scalable, high-performance systems "
+        "that align with business objectives. Expertise in full-stack development, "
+        "cross-functional collaboration, and engineering best practices.",
+        
+        "Accomplished {domain} professional {exp} in {skills}. "
+        "Demonstrated ability to architect and implement robust solutions across the SDLC, "
+        "from requirements gathering to production deployment. "
+        "Recognized for clean code practices, proactive problem-solving, "
+        "and delivering measurable impact in agile environments.",
+    ],
+    "Data Science/ML": [
+        "{soft} data professional {exp} specializing in {skills}. "
+        "Proven ability to transform complex datasets into actionable insights "
+        "and production-ready machine learning models. "
+        "Experienced in building data pipelines, statistical modeling, and A/B testing.",
+    ],
+    "DevOps/Cloud": [
+        "{soft} DevOps/Cloud engineer {exp} with expertise in {skills}. "
+        "Proven record of building and maintaining reliable, scalable infrastructure "
+        "using infrastructure-as-code and CI/CD best practices. "
+        "Committed to improving deployment velocity and system observability.",
+    ],
+}
+
+
+# Quantified-achievement markers (percentages, dollar amounts, multipliers, 2+ digit numbers)
+ACHIEVEMENT_PATTERN = re.compile(r'\d+%|\$[\d,]+|\d+x|\b\d{2,}\b', re.IGNORECASE)
+# Re-checked after the 120-char cut: the truncated achievement may have lost its digits
+DIGIT_PATTERN = re.compile(r'\d')
+
+
+def rewrite_summary(resume_data: dict, jd_analysis: dict,
+                    resume_text_lower: Optional[str] = None) -> str:
     """
     Intelligently rewrite the professional summary
     Uses template system with dynamic keyword insertion
@@ -431,34 +628,35 @@ def rewrite_summary(resume_data: dict, jd_analysis: dict) -> str:
     keywords = jd_analysis.get("keywords", [])
     
     # Get resume's existing skills
-    resume_text = resume_data.get("full_text", "").lower()
+    if resume_text_lower is None:
+        resume_text_lower = resume_data.get("full_text", "").lower()
     resume_skills_list = resume_data.get("skills", [])
     
     # Find skills in BOTH resume and JD (truthful intersection)
-    resume_skills_lower = [s.lower() for s in resume_skills_list]
+    resume_skills_joined = ' '.join(s.lower() for s in resume_skills_list)
     matching_tech_skills = [
         s for s in tech_skills
-        if s.lower() in resume_text or s.lower() in ' '.join(resume_skills_lower)
+        if s.lower() in resume_text_lower or s.lower() in resume_skills_joined
     ][:5]
     
     if not matching_tech_skills:
         matching_tech_skills = tech_skills[:3] if tech_skills else []
     
     # Skills string - use proper case
+    # Original-case resume skills by lowercase name (reversed so the first spelling wins)
+    resume_skill_by_lower = {s.lower(): s for s in reversed(resume_skills_list)}
     matching_display = []
     for ts in matching_tech_skills:
+        ts_lower = ts.lower()
         # Try to find original case version from resume skills
-        found_original = next(
-            (s for s in resume_skills_list if s.lower() == ts.lower()),
-            None
-        )
+        found_original = resume_skill_by_lower.get(ts_lower)
         if not found_original:
             # Use proper capitalization
-            if ts.lower() in ['python', 'react', 'docker', 'kubernetes', 'ansible']:
+            if ts_lower in ['python', 'react', 'docker', 'kubernetes', 'ansible']:
                 found_original = ts.capitalize()
-            elif ts.lower() in ['aws', 'api', 'sql', 'html', 'css', 'git', 'ci/cd', 'gcp']:
+            elif ts_lower in ['aws', 'api', 'sql', 'html', 'css', 'git', 'ci/cd', 'gcp']:
                 found_original = ts.upper()
-            elif ts.lower() in ['javascript', 'typescript']:
+            elif ts_lower in ['javascript', 'typescript']:
                 found_original = ts.capitalize()
             else:
                 found_original = ts.title() if len(ts) > 4 else ts.upper()
@@ -489,7 +687,7 @@ def rewrite_summary(resume_data: dict, jd_analysis: dict) -> str:
     for entry in resume_data.get("experience", []):
         bullets = entry.get("bullets", [])
         for bullet in bullets:
-            if re.search(r'\d+%|\$[\d,]+|\d+x|\b\d{2,}\b', bullet, re.IGNORECASE):
+            if ACHIEVEMENT_PATTERN.search(bullet):
                 best_achievement = bullet[:120]
                 break
         if best_achievement:
@@ -498,35 +696,7 @@ def rewrite_summary(resume_data: dict, jd_analysis: dict) -> str:
     # Get soft skill
     selected_soft = soft_skills[0].capitalize() if soft_skills else "Results-driven"
     
-    # Domain-specific summary templates
-    domain_templates = {
-        "Software Engineering": [
-            "{soft} software engineer {exp} specializing in {skills}. "
-            "Proven track record of designing and delivering scalable, high-performance systems "
-            "that align with business objectives. Expertise in full-stack development, "
-            "cross-functional collaboration, and engineering best practices.",
-            
-            "Accomplished {domain} professional {exp} in {skills}. "
-            "Demonstrated ability to architect and implement robust solutions across the SDLC, "
-            "from requirements gathering to production deployment. "
-            "Recognized for clean code practices, proactive problem-solving, "
-            "and delivering measurable impact in agile environments.",
-        ],
-        "Data Science/ML": [
-            "{soft} data professional {exp} specializing in {skills}. "
-            "Proven ability to transform complex datasets into actionable insights "
-            "and production-ready machine learning models. "
-            "Experienced in building data pipelines, statistical modeling, and A/B testing.",
-        ],
-        "DevOps/Cloud": [
-            "{soft} DevOps/Cloud engineer {exp} with expertise in {skills}. "
-            "Proven record of building and maintaining reliable, scalable infrastructure "
-            "using infrastructure-as-code and CI/CD best practices. "
-            "Committed to improving deployment velocity and system observability.",
-        ],
-    }
-    
-    templates = domain_templates.get(domain, domain_templates["Software Engineering"])
+    templates = SUMMARY_TEMPLATES.get(domain, SUMMARY_TEMPLATES["Software Engineering"])
     template = random.choice(templates)
     
     summary = template.format(
@@ -540,7 +710,7 @@ def rewrite_summary(resume_data: dict, jd_analysis: dict) -> str:
     if best_achievement:
         clean_achievement = best_achievement.strip().rstrip('.')
         # Only append if it adds value (has numbers/metrics)
-        if re.search(r'\d+', clean_achievement):
+        if DIGIT_PATTERN.search(clean_achievement):
             summary = summary.rstrip('.') + f". Notable achievement: {clean_achievement}."
     
     return summary.strip()
@@ -561,37 +731,29 @@ def optimize_skills_section(resume_skills: list, jd_analysis: dict) -> list:
     # Identify what domains the candidate already works in
     existing_domains = set()
     for skill in resume_skills:
-        for domain, domain_skills in SKILLS_DB.items():
-            if skill.lower() in [s.lower() for s in domain_skills]:
-                existing_domains.add(domain)
+        existing_domains.update(SKILL_DOMAINS.get(skill.lower(), ()))
     
     for jd_skill in jd_tech_skills:
+        jd_skill_lower = jd_skill.lower()
         # Skip if already present (case insensitive)
-        if jd_skill.lower() in resume_text_lower:
+        if jd_skill_lower in resume_text_lower:
             continue
         
-        # Check if it's in the same domain as existing skills
-        skill_domain = None
-        for domain, domain_skills in SKILLS_DB.items():
-            if jd_skill.lower() in [s.lower() for s in domain_skills]:
-                skill_domain = domain
-                break
+        # Check if it's in the same domain as existing skills (first listing domain)
+        jd_skill_domains = SKILL_DOMAINS.get(jd_skill_lower)
+        skill_domain = jd_skill_domains[0] if jd_skill_domains else None
         
         # Only add if domain matches (truthful, not fabrication)
         if skill_domain and skill_domain in existing_domains:
             # Use proper case
             optimized.append(jd_skill)
     
-    # Deduplicate (case-insensitive), preserve original case
-    seen = set()
-    deduped = []
+    # Deduplicate (case-insensitive), preserve original case of the first spelling
+    deduped = {}
     for skill in optimized:
-        key = skill.lower()
-        if key not in seen:
-            seen.add(key)
-            deduped.append(skill)
+        deduped.setdefault(skill.lower(), skill)
     
-    return deduped
+    return list(deduped.values())
 
 
 def optimize_experience(experience_list: list, jd_analysis: dict) -> list:
@@ -605,7 +767,7 @@ def optimize_experience(experience_list: list, jd_analysis: dict) -> list:
     jd_keywords = jd_analysis.get("keywords", [])[:10]
     
     optimized_experience = []
-    used_keywords_global: List[str] = []  # Track across ALL bullets
+    used_keywords_global: Set[str] = set()  # Track across ALL bullets
     
     for entry in experience_list:
         optimized_entry = dict(entry)
@@ -626,7 +788,7 @@ def optimize_experience(experience_list: list, jd_analysis: dict) -> list:
 
 
 def enhance_bullet(bullet: str, jd_keywords: list, jd_skills: list,
-                   used_keywords: Optional[List[str]] = None) -> str:
+                   used_keywords: Optional[Set[str]] = None) -> str:
     """
     Enhance a single bullet point:
     1. Apply smart transformations (Responsible for → Built)
@@ -637,22 +799,23 @@ def enhance_bullet(bullet: str, jd_keywords: list, jd_skills: list,
         return bullet
     
     if used_keywords is None:
-        used_keywords = []
+        used_keywords = set()
     
     # Step 1: Apply smart verb transformation
     enhanced = replace_weak_verb(bullet)
     
     # Step 2: Try to insert ONE relevant, unused JD skill keyword
     if len(enhanced) < 160:
+        enhanced_lower = enhanced.lower()
         for skill in jd_skills:
             if skill in used_keywords:
                 continue
-            if skill.lower() in enhanced.lower():
+            if skill.lower() in enhanced_lower:
                 continue
             
-            new_enhanced = insert_keyword_naturally(enhanced, skill)
+            new_enhanced = insert_keyword_naturally(enhanced, skill, enhanced_lower)
             if new_enhanced != enhanced:
-                used_keywords.append(skill)
+                used_keywords.add(skill)
                 enhanced = new_enhanced
                 break
     
@@ -663,10 +826,11 @@ def enhance_bullet(bullet: str, jd_keywords: list, jd_skills: list,
     return enhanced
 
 
-def compute_keyword_diff(before_text: str, after_text: str, jd_keywords: list) -> dict:
-    """Compute which keywords were added in optimization"""
-    before_lower = before_text.lower()
-    after_lower = after_text.lower()
+def compute_keyword_diff(before_text: str, after_text: str, jd_keywords: list,
+                         texts_lowered: bool = False) -> dict:
+    """Compute which keywords were added in optimization (pass texts_lowered if both are already lowercase)"""
+    before_lower = before_text if texts_lowered else before_text.lower()
+    after_lower = after_text if texts_lowered else after_text.lower()
     
     added = []
     already_had = []
@@ -693,12 +857,15 @@ def optimize_resume(resume_data: dict, jd_analysis: dict) -> dict:
     Takes parsed resume + JD analysis → returns optimized structured data
     """
     original_text = resume_data.get("full_text", "")
+    # Lowercase the resume text and JD terms once for every scoring/matching step below
+    original_lower = original_text.lower()
+    jd_lower = lower_jd_terms(jd_analysis)
     
     # 1. Pre-optimization ATS score
-    pre_ats = calculate_ats_score(resume_data, jd_analysis)
+    pre_ats = calculate_ats_score(resume_data, jd_analysis, original_lower, jd_lower)
     
     # 2. Rewrite summary
-    new_summary = rewrite_summary(resume_data, jd_analysis)
+    new_summary = rewrite_summary(resume_data, jd_analysis, original_lower)
     
     # 3. Optimize skills
     original_skills = resume_data.get("skills", [])
@@ -725,22 +892,24 @@ def optimize_resume(resume_data: dict, jd_analysis: dict) -> dict:
     }
     
     # 6. Post-optimization ATS score
-    optimized_text_parts = [new_summary, ' '.join(optimized_skills)]
-    for entry in optimized_experience:
-        optimized_text_parts.extend(entry.get("bullets", []))
-    optimized_text = ' '.join(optimized_text_parts).lower()
+    optimized_text = ' '.join(chain(
+        (new_summary, ' '.join(optimized_skills)),
+        (bullet for entry in optimized_experience for bullet in entry.get("bullets", ())),
+    )).lower()
     
     temp_data = dict(optimized_data)
     temp_data["full_text"] = optimized_text + " " + original_text
     temp_data["raw_sections"] = resume_data.get("raw_sections", {})
     temp_data["contact"] = resume_data.get("contact", {})
-    post_ats = calculate_ats_score(temp_data, jd_analysis)
+    post_ats = calculate_ats_score(temp_data, jd_analysis,
+                                   optimized_text + " " + original_lower, jd_lower)
     
     # 7. Keyword diff
     kw_diff = compute_keyword_diff(
-        original_text,
+        original_lower,
         optimized_text,
-        jd_analysis.get("technical_skills", []) + jd_analysis.get("keywords", [])
+        jd_analysis.get("technical_skills", []) + jd_analysis.get("keywords", []),
+        texts_lowered=True
     )
     
     return {
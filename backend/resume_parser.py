@@ -5,7 +5,10 @@ Detects sections, extracts content, preserves structure
 
 import re
 import io
+import datetime
+from functools import lru_cache
 from typing import Optional
+from docx import Document
 
 # ─── Section Headers Detection ─────────────────────────────────────────────
 SECTION_PATTERNS = {
@@ -45,38 +48,31 @@ SECTION_PATTERNS = {
 }
 
 
+# Every section in one anchored alternation, one named group per section.
+# Alternatives are tried in SECTION_PATTERNS order, so the first section that
+# matches the whole line wins, exactly like checking the sections one by one.
+SECTION_PATTERN = re.compile(
+    r'^(?:' + '|'.join(
+        f'(?P<{section}>' + '|'.join(patterns) + ')'
+        for section, patterns in SECTION_PATTERNS.items()
+    ) + r')\s*$'
+)
+NON_ALPHA_PATTERN = re.compile(r'[^a-z\s]')
+
+
+@lru_cache(maxsize=1024)
 def detect_section(line: str) -> Optional[str]:
-    """Detect if a line is a section header"""
+    """Detect if a line is a section header (cached - blank and repeated lines are common)"""
     line_clean = line.strip().lower()
-    line_clean = re.sub(r'[^a-z\s]', '', line_clean).strip()
-    
-    for section, patterns in SECTION_PATTERNS.items():
-        for pattern in patterns:
-            if re.match(r'^' + pattern + r'\s*$', line_clean):
-                return section
-            if line_clean == pattern.lower():
-                return section
-    return None
+    line_clean = NON_ALPHA_PATTERN.sub('', line_clean).strip()
+    
+    match = SECTION_PATTERN.match(line_clean)
+    return match.lastgroup if match else None
 
 
-def is_likely_header(line: str) -> bool:
-    """Heuristic to detect section headers"""
-    line = line.strip()
-    if not line:
-        return False
-    
-    # All caps, short line
-    if line.isupper() and len(line) < 60 and len(line) > 2:
-        return True
-    
-    # Title case, short, no punctuation at end
-    if line[0].isupper() and len(line) < 50 and not line.endswith('.'):
-        words = line.split()
-        if all(w[0].isupper() for w in words if w):
-            if detect_section(line):
-                return True
-    
-    return False
+def is_caps_header(line: str) -> bool:
+    """All caps, short line (line already stripped)"""
+    return line.isupper() and 2 < len(line) < 60
 
 
 def extract_name(lines: list) -> str:
@@ -99,61 +95,107 @@ def extract_name(lines: list) -> str:
     return ""
 
 
-def extract_contact_info(text: str) -> dict:
-    """Extract contact information"""
+# ─── Contact / date patterns ────────────────────────────────────────────────
+# Every start inside one run of local-part characters reaches the same '@', so they
+# all succeed or fail together. The lookbehind only tries the first start of each
+# run: same leftmost match as the plain pattern, but linear instead of quadratic
+# on long '@'-less runs.
+EMAIL_PATTERN = re.compile(r'(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'(?:\+?1[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+GITHUB_PATTERN = re.compile(r'github\.com/[\w-]+', re.IGNORECASE)
+# Location "City Name, ST[ 12345]" starting a line. Matched as: a maximal run of
+# letters/whitespace (entered once, from its first character) directly followed by
+# the ", ST" tail, then the first line-start capital inside that run. Equivalent to
+# (?:^|\n)([A-Z][a-zA-Z\s]+,\s*[A-Z]{2}(?:\s+\d{5})?) with re.MULTILINE, which
+# rescans the rest of the run from every line start and goes quadratic.
+LOCATION_RUN_PATTERN = re.compile(r'(?<![a-zA-Z\s])[a-zA-Z\s]+(?=,\s*[A-Z]{2})')
+LOCATION_TAIL_PATTERN = re.compile(r',\s*[A-Z]{2}(?:\s+\d{5})?')
+LINE_START_CAPITAL_PATTERN = re.compile(r'^[A-Z]', re.MULTILINE)
+YEAR_PATTERN = re.compile(r'\b(?:19|20)\d{2}\b')
+EXPLICIT_YEARS_PATTERN = re.compile(r'(\d+)\+?\s*years?\s*(?:of\s+)?(?:experience|exp)', re.IGNORECASE)
+# Month names as abbreviation + optional remainder: one branch per month instead
+# of trying the short form, failing on the next letter and backtracking to the long one
+DATE_PATTERN = re.compile(
+    r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?|'
+    r'Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\.?\s+\d{4}|'
+    r'\d{4}\s*[-–—]\s*(?:\d{4}|present|current|now)',
+    re.IGNORECASE
+)
+BULLET_CHARS = ('•', '-', '–', '●', '*', '·', '▪')
+# Skill delimiters folded onto ',' so one str.split replaces a regex split
+SKILLS_DELIMITERS = str.maketrans({'|': ',', '•': ',', '\n': ',', '\t': ','})
+
+
+def find_location(text: str) -> Optional[str]:
+    """First line-start "City, ST" location in text, or None"""
+    for run in LOCATION_RUN_PATTERN.finditer(text):
+        # endpos keeps at least one run character between the capital and the comma
+        start = LINE_START_CAPITAL_PATTERN.search(text, run.start(), run.end() - 1)
+        if start:
+            tail = LOCATION_TAIL_PATTERN.match(text, run.end())
+            return text[start.start():tail.end()]
+    return None
+
+
+# The candidate's own location sits in the resume header; lines further down
+# are job/school locations and are not scanned
+LOCATION_SCAN_LINES = 15
+
+
+def extract_contact_info(text: str, lines: Optional[list] = None) -> dict:
+    """Extract contact information (pass the text's lines if already split)"""
     contact = {}
     
     # Email
-    email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
+    email_match = EMAIL_PATTERN.search(text)
     if email_match:
         contact['email'] = email_match.group()
     
     # Phone
-    phone_match = re.search(
-        r'(?:\+?1[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}',
-        text
-    )
+    phone_match = PHONE_PATTERN.search(text)
     if phone_match:
         contact['phone'] = phone_match.group()
     
     # LinkedIn
-    linkedin_match = re.search(r'linkedin\.com/in/[\w-]+', text, re.IGNORECASE)
+    linkedin_match = LINKEDIN_PATTERN.search(text)
     if linkedin_match:
         contact['linkedin'] = linkedin_match.group()
     
     # GitHub
-    github_match = re.search(r'github\.com/[\w-]+', text, re.IGNORECASE)
+    github_match = GITHUB_PATTERN.search(text)
     if github_match:
         contact['github'] = github_match.group()
     
-    # Location (city, state pattern)
-    location_match = re.search(
-        r'(?:^|\n)([A-Z][a-zA-Z\s]+,\s*[A-Z]{2}(?:\s+\d{5})?)',
-        text, re.MULTILINE
-    )
-    if location_match:
-        contact['location'] = location_match.group(1).strip()
+    # Location (city, state pattern) - header lines only
+    if lines is None:
+        lines = text.split('\n')
+    location = find_location('\n'.join(lines[:LOCATION_SCAN_LINES]))
+    if location:
+        contact['location'] = location.strip()
     
     return contact
 
 
 def extract_years_experience(text: str) -> int:
     """Estimate total years of experience from resume"""
-    import datetime
-    current_year = datetime.datetime.now().year
+    current_year = datetime.date.today().year
     
-    # Look for year ranges in experience section
-    year_pattern = r'\b(19|20)\d{2}\b'
-    years = [int(y) for y in re.findall(year_pattern, text)]
+    # Look for year ranges in experience section: needs 2+ year mentions,
+    # measured from the earliest plausible one (single pass, no year list)
+    mentions = 0
+    earliest = None
+    for match in YEAR_PATTERN.finditer(text):
+        mentions += 1
+        year = int(match.group())
+        if 1990 <= year <= current_year and (earliest is None or year < earliest):
+            earliest = year
     
-    if len(years) >= 2:
-        years = [y for y in years if 1990 <= y <= current_year]
-        if years:
-            earliest = min(years)
-            return current_year - earliest
+    if mentions >= 2 and earliest is not None:
+        return current_year - earliest
     
     # Look for explicit "X years of experience"
-    exp_match = re.search(r'(\d+)\+?\s*years?\s*(?:of\s+)?(?:experience|exp)', text, re.IGNORECASE)
+    exp_match = EXPLICIT_YEARS_PATTERN.search(text)
     if exp_match:
         return int(exp_match.group(1))
     
@@ -172,20 +214,14 @@ def parse_experience_entries(text: str) -> list:
     current_entry = None
     current_bullets = []
     
-    date_pattern = re.compile(
-        r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|'
-        r'April|June|July|August|September|October|November|December)\.?\s+\d{4}|'
-        r'\d{4}\s*[-–—]\s*(?:\d{4}|present|current|now)',
-        re.IGNORECASE
-    )
-    
     for line in lines:
         line = line.strip()
         if not line:
             continue
         
-        # Check if this is a new job entry (has a date)
-        if date_pattern.search(line):
+        # Check if this is a new job entry (has a date); searched once per line
+        date_match = DATE_PATTERN.search(line)
+        if date_match:
             if current_entry:
                 current_entry['bullets'] = current_bullets
                 entries.append(current_entry)
@@ -193,7 +229,7 @@ def parse_experience_entries(text: str) -> list:
             # Try to extract company/role from context
             current_entry = {
                 'raw': line,
-                'dates': date_pattern.search(line).group() if date_pattern.search(line) else '',
+                'dates': date_match.group(),
                 'company': '',
                 'role': '',
                 'location': ''
@@ -202,13 +238,14 @@ def parse_experience_entries(text: str) -> list:
             
         elif current_entry is not None:
             # Check if it's a bullet point
-            if line.startswith(('•', '-', '–', '●', '*', '·', '▪')):
-                bullet_text = re.sub(r'^[•\-–●\*·▪]\s*', '', line).strip()
+            if line.startswith(BULLET_CHARS):
+                # Every bullet glyph is one character; strip() also drops the space after it
+                bullet_text = line[1:].strip()
                 if bullet_text:
                     current_bullets.append(bullet_text)
             elif line and not line.startswith(('•', '-', '–')):
                 # Could be company/role line
-                if not current_entry.get('company') and not date_pattern.search(line):
+                if not current_entry.get('company'):
                     current_entry['company'] = line[:100]
     
     # Add last entry
@@ -240,7 +277,7 @@ def parse_text_to_sections(text: str) -> dict:
     
     # Extract name and contact
     sections["name"] = extract_name(lines)
-    sections["contact"] = extract_contact_info(text)
+    sections["contact"] = extract_contact_info(text, lines)
     
     # Parse sections
     current_section = None
@@ -250,9 +287,9 @@ def parse_text_to_sections(text: str) -> dict:
     for line in lines:
         line_stripped = line.strip()
         
-        # Check for section header
+        # Check for section header: a known section title, or a short all-caps line
         detected = detect_section(line_stripped)
-        if detected or is_likely_header(line_stripped):
+        if detected or is_caps_header(line_stripped):
             # Save previous section
             if current_section and section_content:
                 raw_sections[current_section] = '\n'.join(section_content)
@@ -276,7 +313,7 @@ def parse_text_to_sections(text: str) -> dict:
     if "skills" in raw_sections:
         skills_text = raw_sections["skills"]
         # Extract skills (split by common delimiters)
-        skills = re.split(r'[,|•\n\t]+', skills_text)
+        skills = skills_text.translate(SKILLS_DELIMITERS).split(',')
         sections["skills"] = [s.strip() for s in skills if s.strip() and len(s.strip()) > 1]
     
     if "experience" in raw_sections:
@@ -303,15 +340,12 @@ def parse_text_to_sections(text: str) -> dict:
 def parse_docx(file_bytes: bytes) -> dict:
     """Parse a DOCX file into structured resume data"""
     try:
-        from docx import Document
         doc = Document(io.BytesIO(file_bytes))
         
-        full_text = []
-        for para in doc.paragraphs:
-            if para.text.strip():
-                full_text.append(para.text)
-        
-        text = '\n'.join(full_text)
+        # para.text is rebuilt from the runs on every access, so read it once;
+        # isspace() rejects blank paragraphs without allocating a stripped copy
+        paragraphs = (para.text for para in doc.paragraphs)
+        text = '\n'.join(t for t in paragraphs if t and not t.isspace())
         result = parse_text_to_sections(text)
         result["source_format"] = "docx"
         return result
@@ -320,6 +354,11 @@ def parse_docx(file_bytes: bytes) -> dict:
         return {"error": str(e), "full_text": ""}
 
 
+# Resumes fit in a few pages; text past this is never extracted, which bounds the
+# work a long or hostile PDF can cost
+MAX_PDF_PAGES = 5
+
+
 def parse_pdf(file_bytes: bytes) -> dict:
     """Parse a PDF file into structured resume data"""
     text = ""
@@ -329,7 +368,7 @@ def parse_pdf(file_bytes: bytes) -> dict:
         import pdfplumber
         with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
             pages_text = []
-            for page in pdf.pages:
+            for page in pdf.pages[:MAX_PDF_PAGES]:
                 page_text = page.extract_text()
                 if page_text:
                     pages_text.append(page_text)
@@ -337,13 +376,29 @@ def parse_pdf(file_bytes: bytes) -> dict:
     except Exception:
         pass
     
-    # Fallback to PyPDF2
+    # Fallback to PDFium (native engine; pdfplumber already depends on pypdfium2)
+    if not text:
+        try:
+            import pypdfium2 as pdfium
+            pdf = pdfium.PdfDocument(file_bytes)
+            try:
+                pages_text = []
+                for i in range(min(len(pdf), MAX_PDF_PAGES)):
+                    page_text = pdf[i].get_textpage().get_text_bounded()
+                    if page_text:
+                        pages_text.append(page_text)
+                text = '\n'.join(pages_text).replace('\r\n', '\n')
+            finally:
+                pdf.close()
+        except Exception:
+            pass
+    
+    # Last resort: PyPDF2 (pure Python)
     if not text:
         try:
             import PyPDF2
             reader = PyPDF2.PdfReader(io.BytesIO(file_bytes))
-            for page in reader.pages:
-                text += page.extract_text() or ''
+            text = ''.join(page.extract_text() or '' for page in reader.pages[:MAX_PDF_PAGES])
         except Exception:
             pass
     
@@ -3,6 +3,8 @@
 # 600+ skills across all major domains
 # ============================================================
 
+import sys
+
 SKILLS_DB = {
     "programming_languages": [
         "python", "javascript", "typescript", "java", "c++", "c#", "c", "go", "golang",
@@ -112,11 +114,18 @@ SKILLS_DB = {
     ]
 }
 
-# Flatten all skills for quick lookup
-ALL_SKILLS = set()
+# Flatten all skills for quick lookup (immutable - shared by every importer).
+# Lowered names are interned so every index over the taxonomy holds the same
+# string objects and lookups between them hit the identity fast path.
+ALL_SKILLS = frozenset(sys.intern(skill.lower()) for skills in SKILLS_DB.values() for skill in skills)
+
+# Inverted index: lowercase skill → every domain listing it, in SKILLS_DB order
+SKILL_DOMAINS = {}
 for category, skills in SKILLS_DB.items():
     for skill in skills:
-        ALL_SKILLS.add(skill.lower())
+        domains = SKILL_DOMAINS.setdefault(sys.intern(skill.lower()), [])
+        if category not in domains:
+            domains.append(category)
 
 # Action verb mapping: weak → strong
 VERB_UPGRADES = {
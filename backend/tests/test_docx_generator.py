@@ -0,0 +1,57 @@
+import io
+
+import docx
+import pytest
+
+from docx_generator import generate_docx_fast, write_docx
+
+STRUCTURED_RESUME = {
+    "name": "Jane Doe",
+    "contact": {"email": "jane@example.com", "phone": "555-0100", "github": "github.com/jane"},
+    "summary": "Backend engineer & mentor <focused> on reliable APIs.",
+    "skills": ["Python", "FastAPI", "PostgreSQL", "Docker", "AWS", "Redis", "Kafka", "Go"],
+    "experience": [
+        {
+            "company": "Acme",
+            "role": "Senior Engineer",
+            "dates": "2019 - Present",
+            "location": "Austin, TX",
+            "bullets": ["Built the billing service", "  ", "Cut p99 latency by 40%"],
+        },
+        {"raw": "Contractor\tvarious clients", "bullets": ["Shipped\ttools"]},
+    ],
+    "education": "B.S. Computer Science\nState University, 2014",
+    "projects": "Resume Optimizer\n• Parses DOCX and PDF\n- Scores ATS matches",
+    "certifications": "AWS Solutions Architect\n• CKA",
+}
+
+RAW_EXPERIENCE_RESUME = {
+    "name": "",
+    "contact": {},
+    "experience_raw": "Acme Corp 2018 - 2021\nSoftware Engineer\n● Owned the data pipeline\n* On call",
+    "education": "Diploma in Networking",
+}
+
+
+def paragraphs(data: bytes) -> list:
+    """Text, style, spacing, border and run formatting of every paragraph"""
+    result = []
+    for paragraph in docx.Document(io.BytesIO(data)).paragraphs:
+        ppr = paragraph._p.pPr
+        result.append((
+            paragraph.text,
+            paragraph.style.name,
+            paragraph.paragraph_format.space_before,
+            paragraph.paragraph_format.space_after,
+            paragraph.paragraph_format.first_line_indent,
+            ppr is not None and ppr.find(docx.oxml.ns.qn("w:pBdr")) is not None,
+            [(run.text, run.bold, run.style.name) for run in paragraph.runs],
+        ))
+    return result
+
+
+@pytest.mark.parametrize("resume_data", [STRUCTURED_RESUME, RAW_EXPERIENCE_RESUME])
+def test_fast_writer_matches_reference(resume_data):
+    reference = io.BytesIO()
+    write_docx(resume_data, reference)
+    assert paragraphs(generate_docx_fast(resume_data)) == paragraphs(reference.getvalue())
@@ -0,0 +1,23 @@
+import datetime
+
+from resume_parser import extract_years_experience
+
+
+def test_years_measured_from_earliest_full_year():
+    current_year = datetime.date.today().year
+    text = "Software Engineer, Acme 2015 - 2019\nSenior Engineer, Globex 2019 - Present"
+    assert extract_years_experience(text) == current_year - 2015
+
+
+def test_years_ignore_out_of_range_mentions():
+    current_year = datetime.date.today().year
+    text = "Born 1985. Analyst 2012 - 2016. Patent expires 2099."
+    assert extract_years_experience(text) == current_year - 2012
+
+
+def test_years_fall_back_to_explicit_phrase():
+    assert extract_years_experience("Engineer since 2018 with 7+ years of experience") == 7
+
+
+def test_years_default():
+    assert extract_years_experience("No dates here") == 3
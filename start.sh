@@ -32,7 +32,15 @@ if [ -f "venv/bin/activate" ]; then
     source venv/bin/activate
 fi
 
-nohup python -m uvicorn main:app --host 0.0.0.0 --port 8000 --log-level warning > ../logs/backend.log 2>&1 &
+# Each uvicorn worker is a separate process with its own parse/optimize caches and PDF
+# pools, so more workers means more memory; default to the core count, capped at 4.
+# LIBREOFFICE_WORKERS / PDF_PROCESS_WORKERS size those pools per worker, and
+# LIBREOFFICE_PDF=1 opts in to LibreOffice PDF conversion (see README)
+CORES=$(getconf _NPROCESSORS_ONLN 2>/dev/null || echo 1)
+WORKERS=${WEB_CONCURRENCY:-$(( CORES < 4 ? CORES : 4 ))}
+export WEB_CONCURRENCY=$WORKERS
+nohup python -m uvicorn main:app --host 0.0.0.0 --port 8000 --workers "$WORKERS" \
+    --loop uvloop --http httptools --no-access-log --log-level warning > ../logs/backend.log 2>&1 &
 BACKEND_PID=$!
 echo $BACKEND_PID > ../pids/backend.pid
 echo -e "${GREEN}✓ Backend started (PID: $BACKEND_PID)${NC}"